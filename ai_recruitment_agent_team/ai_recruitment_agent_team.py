@@ -1,9 +1,10 @@
-from typing import Literal, Tuple, Dict, Optional
+from typing import Any, Callable, Literal, Tuple, Dict, Optional
+import hashlib
 import os
+import threading
 import time
 import json
 import requests
-import PyPDF2
 from datetime import datetime, timedelta
 import pytz
 
@@ -15,6 +16,9 @@ from phi.tools.zoom import ZoomTool
 from phi.utils.log import logger
 from streamlit_pdf_viewer import pdf_viewer
 
+from disk_cache import DiskCache, make_cache_key
+from pdf_extraction import PDF_EXTRACTION_MAX_PAGES, get_extraction_service, read_pdf_bytes
+
 
 
 class CustomZoomTool(ZoomTool):
@@ -85,29 +89,122 @@ ROLE_REQUIREMENTS: Dict[str, str] = {
     """
 }
 
+# Model used for resume analysis; part of the analysis cache key
+RESUME_ANALYSIS_MODEL = "gpt-4o"
+
+# Changes whenever any role's requirements are edited, invalidating cached analyses
+ROLE_REQUIREMENTS_VERSION = make_cache_key(ROLE_REQUIREMENTS)[:16]
+
+# Extracted resume text and analysis results, keyed by content hash, shared by every process on the host
+resume_cache = DiskCache(
+    os.environ.get("RESUME_CACHE_PATH", os.path.join(".cache", "resumes.db")),
+    ttl_seconds=int(os.environ.get("RESUME_CACHE_TTL", 30 * 24 * 3600)),
+    max_entries=int(os.environ.get("RESUME_CACHE_MAX_ENTRIES", 5000)),
+)
+
+
+# Shared Zoom tools unused for this long are dropped from the registry
+TOOL_IDLE_SECONDS = int(os.environ.get("TOOL_IDLE_SECONDS", 30 * 60))
+
+
+def timed_build(kind: str, factory: Callable[[], Any]) -> Any:
+    """Call factory and log how long building the instance took."""
+    started_at = time.perf_counter()
+    instance = factory()
+    logger.info(f"Built {kind} in {(time.perf_counter() - started_at) * 1000:.1f}ms")
+    return instance
+
+
+class ToolRegistry:
+    """Keyed store of tools shared by every session, dropped after idle_seconds unused.
+
+    Keys are hashes of the kind and its full configuration (credentials included), so
+    changing any setting builds a new instance. Only objects that are safe to use from
+    several sessions at once belong here, e.g. CustomZoomTool and its OAuth token.
+    """
+
+    def __init__(self, idle_seconds: int = TOOL_IDLE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self._entries: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, config: Dict, factory: Callable[[], Any]) -> Any:
+        """Return the cached instance for (kind, config), building it with factory on a miss."""
+        key = make_cache_key(kind, config)
+        now = time.monotonic()
+        with self._lock:
+            for stale in [k for k, (_, last_used) in self._entries.items() if now - last_used > self.idle_seconds]:
+                del self._entries[stale]
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1] = now
+                return entry[0]
+
+        instance = timed_build(kind, factory)
+        with self._lock:
+            # Another session may have built the same entry meanwhile; keep the first one
+            entry = self._entries.setdefault(key, [instance, time.monotonic()])
+        return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@st.cache_resource
+def get_tool_registry() -> ToolRegistry:
+    """Process-wide tool registry, shared by every session and rerun."""
+    return ToolRegistry()
+
+
+def session_agent(kind: str, config: Dict, factory: Callable[[], Agent]) -> Agent:
+    """Return this session's agent of a kind, rebuilding it only when its config changes.
+
+    Agents hold per-run state and are not safe to run concurrently, so they live in
+    st.session_state and are never shared between sessions.
+    """
+    key = make_cache_key(kind, config)
+    cached = st.session_state.agents.get(kind)
+    if cached is None or cached[0] != key:
+        st.session_state.agents[kind] = (key, timed_build(kind, factory))
+    return st.session_state.agents[kind][1]
+
 
 def init_session_state() -> None:
     """Initialize only necessary session state variables."""
     defaults = {
         'candidate_email': "", 'openai_api_key': "", 'resume_text': "", 'analysis_complete': False,
         'is_selected': False, 'zoom_account_id': "", 'zoom_client_id': "", 'zoom_client_secret': "",
-        'email_sender': "", 'email_passkey': "", 'company_name': "", 'current_pdf': None
+        'email_sender': "", 'email_passkey': "", 'company_name': "", 'current_pdf': None,
+        'current_pdf_bytes': None, 'current_pdf_hash': "", 'agents': {}
     }
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
 
 
-def create_resume_analyzer() -> Agent:
-    """Creates and returns a resume analysis agent."""
-    if not st.session_state.openai_api_key:
+def create_resume_analyzer(api_key: Optional[str] = None, reuse: bool = True) -> Agent:
+    """Returns a resume analysis agent, using the session's API key unless one is given.
+
+    The agent is kept for the session unless reuse is False, e.g. for callers outside
+    Streamlit that run several analyses concurrently and need one agent per thread.
+    """
+    api_key = api_key or st.session_state.openai_api_key
+    if not api_key:
         st.error("Please enter your OpenAI API key first.")
         return None
 
+    if reuse:
+        return session_agent(
+            "resume_analyzer",
+            {"api_key": api_key, "model": RESUME_ANALYSIS_MODEL},
+            lambda: create_resume_analyzer(api_key, reuse=False),
+        )
+
     return Agent(
         model=OpenAIChat(
-            id="gpt-4o",
-            api_key=st.session_state.openai_api_key
+            id=RESUME_ANALYSIS_MODEL,
+            api_key=api_key
         ),
         description="You are an expert technical recruiter who analyzes resumes.",
         instructions=[
@@ -120,7 +217,25 @@ def create_resume_analyzer() -> Agent:
         markdown=True
     )
 
-def create_email_agent() -> Agent:
+def create_email_agent(reuse: bool = True) -> Agent:
+    """Returns the email agent for the session's credentials and current candidate.
+
+    The agent is kept in session state and rebuilt only when the OpenAI key, the
+    sender's credentials, the company name or the candidate email change.
+    """
+    if reuse:
+        return session_agent(
+            "email_agent",
+            {
+                "api_key": st.session_state.openai_api_key,
+                "receiver_email": st.session_state.candidate_email,
+                "sender_email": st.session_state.email_sender,
+                "sender_name": st.session_state.company_name,
+                "sender_passkey": st.session_state.email_passkey,
+            },
+            lambda: create_email_agent(reuse=False),
+        )
+
     return Agent(
         model=OpenAIChat(
             id="gpt-4o",
@@ -147,17 +262,26 @@ def create_email_agent() -> Agent:
 
 
 def create_scheduler_agent() -> Agent:
-    zoom_tools = CustomZoomTool(
-        account_id=st.session_state.zoom_account_id,
-        client_id=st.session_state.zoom_client_id,
-        client_secret=st.session_state.zoom_client_secret
+    zoom_config = {
+        "account_id": st.session_state.zoom_account_id,
+        "client_id": st.session_state.zoom_client_id,
+        "client_secret": st.session_state.zoom_client_secret,
+    }
+    # Shared across sessions so every scheduling run reuses the OAuth token
+    zoom_tools = get_tool_registry().get("zoom_tool", zoom_config, lambda: CustomZoomTool(**zoom_config))
+    return session_agent(
+        "scheduler_agent",
+        {"api_key": st.session_state.openai_api_key, "zoom": zoom_config},
+        lambda: build_scheduler_agent(st.session_state.openai_api_key, zoom_tools),
     )
 
+
+def build_scheduler_agent(api_key: str, zoom_tools: CustomZoomTool) -> Agent:
     return Agent(
         name="Interview Scheduler",
         model=OpenAIChat(
             id="gpt-4o",
-            api_key=st.session_state.openai_api_key
+            api_key=api_key
         ),
         tools=[zoom_tools],
         description="You are an interview scheduling coordinator.",
@@ -176,24 +300,51 @@ def create_scheduler_agent() -> Agent:
 
 def extract_text_from_pdf(pdf_file) -> str:
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        data = read_pdf_bytes(pdf_file)
+        cache_key = make_cache_key("pdf_text", hashlib.sha256(data).hexdigest(), PDF_EXTRACTION_MAX_PAGES)
+        cached = resume_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached PDF text")
+            return cached
+
+        result = get_extraction_service().extract(data)
+        if result["error"]:
+            raise ValueError(result["error"])
+        if result["truncated"]:
+            logger.warning(f"Only the first {result['pages']} of {result['total_pages']} PDF pages were extracted")
+        logger.info(f"Extracted {result['pages']} PDF pages in {result['seconds']:.2f}s")
+        if result["text"]:
+            resume_cache.set(cache_key, result["text"])
+        return result["text"]
     except Exception as e:
         st.error(f"Error extracting PDF text: {str(e)}")
         return ""
 
 
-def analyze_resume(
+def analyze_resume_details(
     resume_text: str,
     role: Literal["ai_ml_engineer", "frontend_engineer", "backend_engineer"],
     analyzer: Agent
-) -> Tuple[bool, str]:
-    try:
-        response = analyzer.run(
-            f"""Please analyze this resume against the following requirements and provide your response in valid JSON format:
+) -> Dict:
+    """Run the analyzer and return its parsed JSON result; raises ValueError on a malformed response.
+
+    Results are cached by resume content, role, requirements version and model, so
+    re-analyzing the same resume for the same role returns without calling the model.
+    """
+    cache_key = make_cache_key(
+        "resume_analysis",
+        hashlib.sha256(resume_text.encode("utf-8")).hexdigest(),
+        role,
+        ROLE_REQUIREMENTS_VERSION,
+        RESUME_ANALYSIS_MODEL,
+    )
+    cached = resume_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached resume analysis")
+        return cached
+
+    response = analyzer.run(
+        f"""Please analyze this resume against the following requirements and provide your response in valid JSON format:
             Role Requirements:
             {ROLE_REQUIREMENTS[role]}
             Resume Text:
@@ -214,16 +365,27 @@ def analyze_resume(
             5. Look for evidence of continuous learning and adaptability
             Important: Return ONLY the JSON object without any markdown formatting or backticks.
             """
-        )
+    )
 
-        assistant_message = next((msg.content for msg in response.messages if msg.role == 'assistant'), None)
-        if not assistant_message:
-            raise ValueError("No assistant message found in response.")
+    assistant_message = next((msg.content for msg in response.messages if msg.role == 'assistant'), None)
+    if not assistant_message:
+        raise ValueError("No assistant message found in response.")
 
-        result = json.loads(assistant_message.strip())
-        if not isinstance(result, dict) or not all(k in result for k in ["selected", "feedback"]):
-            raise ValueError("Invalid response format")
+    result = json.loads(assistant_message.strip())
+    if not isinstance(result, dict) or not all(k in result for k in ["selected", "feedback"]):
+        raise ValueError("Invalid response format")
 
+    resume_cache.set(cache_key, result)
+    return result
+
+
+def analyze_resume(
+    resume_text: str,
+    role: Literal["ai_ml_engineer", "frontend_engineer", "backend_engineer"],
+    analyzer: Agent
+) -> Tuple[bool, str]:
+    try:
+        result = analyze_resume_details(resume_text, role, analyzer)
         return result["selected"], result["feedback"]
 
     except (json.JSONDecodeError, ValueError) as e:
@@ -363,39 +525,41 @@ def main() -> None:
     # Add a "New Application" button before the resume upload
     if st.button("📝 New Application"):
         # Clear only the application-related states
-        keys_to_clear = ['resume_text', 'analysis_complete', 'is_selected', 'candidate_email', 'current_pdf']
+        keys_to_clear = ['resume_text', 'analysis_complete', 'is_selected', 'candidate_email', 'current_pdf',
+                         'current_pdf_bytes', 'current_pdf_hash']
         for key in keys_to_clear:
             if key in st.session_state:
-                st.session_state[key] = None if key == 'current_pdf' else ""
+                st.session_state[key] = None if key in ('current_pdf', 'current_pdf_bytes') else ""
+        # Start the next candidate with fresh agents rather than the previous run history
+        st.session_state.agents = {}
         st.rerun()
 
     resume_file = st.file_uploader("Upload your resume (PDF)", type=["pdf"], key="resume_uploader")
     if resume_file is not None and resume_file != st.session_state.get('current_pdf'):
         st.session_state.current_pdf = resume_file
+        # Read the upload once; every rerun shares these immutable bytes
+        st.session_state.current_pdf_bytes = resume_file.getvalue()
+        st.session_state.current_pdf_hash = hashlib.sha256(st.session_state.current_pdf_bytes).hexdigest()
         st.session_state.resume_text = ""
         st.session_state.analysis_complete = False
         st.session_state.is_selected = False
         st.rerun()
 
-    if resume_file:
+    if resume_file and st.session_state.current_pdf_bytes:
+        pdf_bytes = st.session_state.current_pdf_bytes
         st.subheader("Uploaded Resume")
         col1, col2 = st.columns([4, 1])
         
         with col1:
-            import tempfile, os
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                tmp_file.write(resume_file.read())
-                tmp_file_path = tmp_file.name
-            resume_file.seek(0)
-            try: pdf_viewer(tmp_file_path)
-            finally: os.unlink(tmp_file_path)
+            # The hash key keeps one viewer instance per file; pdf_viewer still re-encodes and resends the bytes each rerun
+            pdf_viewer(pdf_bytes, key=f"pdf_viewer_{st.session_state.current_pdf_hash}")
         
         with col2:
-            st.download_button(label="📥 Download", data=resume_file, file_name=resume_file.name, mime="application/pdf")
+            st.download_button(label="📥 Download", data=pdf_bytes, file_name=resume_file.name, mime="application/pdf")
         # Process the resume text
         if not st.session_state.resume_text:
             with st.spinner("Processing your resume..."):
-                resume_text = extract_text_from_pdf(resume_file)
+                resume_text = extract_text_from_pdf(pdf_bytes)
                 if resume_text:
                     st.session_state.resume_text = resume_text
                     st.success("Resume processed successfully!")
@@ -0,0 +1,238 @@
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+
+from time_slots import (
+    MINUTES_PER_DAY,
+    build_availability_grid,
+    format_slot,
+    get_date_range,
+    get_scoring_model,
+    resolve_attendees,
+    slot_fits,
+)
+
+
+def _meeting_key(meeting, index):
+    return meeting.get('id', index)
+
+
+class BatchScheduler:
+    """Assign many meeting requests to slots from a shared interviewer pool without double-booking.
+
+    Meetings are placed greedily, most constrained first, each taking its best
+    scoring feasible slot and consuming the interviewers' time. A repair pass then
+    tries to place leftover meetings by moving one conflicting meeting elsewhere.
+    """
+
+    def __init__(self, interviewers, date_range, target_timezone="UTC", step_minutes=30,
+                 default_duration=60, max_meetings_per_day=None):
+        self.date_range = list(date_range)
+        self.target_timezone = target_timezone
+        self.step_minutes = step_minutes
+        self.default_duration = default_duration
+        self.scoring_model = get_scoring_model()
+
+        self.names = [interviewer['name'] for interviewer in interviewers]
+        self.availabilities = dict(zip(self.names, resolve_attendees(interviewers, self.date_range)))
+        # Free minutes per interviewer; scheduled meetings are carved out of these grids
+        self.free = {
+            name: build_availability_grid(availability, self.date_range, target_timezone)
+            for name, availability in self.availabilities.items()
+        }
+        self.daily_caps = {
+            interviewer['name']: interviewer.get('max_meetings_per_day', max_meetings_per_day)
+            for interviewer in interviewers
+        }
+        self.daily_load = {name: np.zeros(len(self.date_range), dtype=np.int32) for name in self.names}
+        self.total_load = defaultdict(int)
+
+    def _person_fits(self, name, duration):
+        """Step-aligned (days, starts) mask of where an interviewer can still take a meeting."""
+        fits = slot_fits(self.free[name], duration)[:, ::self.step_minutes]
+        cap = self.daily_caps[name]
+        if cap is not None:
+            fits = fits & (self.daily_load[name] < cap)[:, None]
+        return fits
+
+    def _prepare(self, meeting):
+        """Resolve the non-pool attendees (e.g. the candidate) of a meeting once."""
+        for name in list(meeting.get('interviewers', [])) + list(meeting.get('interviewer_pool', [])):
+            if name not in self.free:
+                raise ValueError(f"Unknown interviewer: {name}")
+
+        attendees = meeting.get('attendees', [])
+        availabilities = resolve_attendees(attendees, self.date_range) if attendees else []
+        duration = meeting.get('duration_minutes', self.default_duration)
+        if availabilities:
+            grids = [build_availability_grid(a, self.date_range, self.target_timezone) for a in availabilities]
+            attendee_fits = slot_fits(np.logical_and.reduce(grids), duration)[:, ::self.step_minutes]
+        else:
+            attendee_fits = None
+        return {
+            'meeting': meeting,
+            'duration': duration,
+            'required': list(meeting.get('interviewers', [])),
+            'pool': [name for name in meeting.get('interviewer_pool', []) if name not in meeting.get('interviewers', [])],
+            'count': meeting.get('interviewer_count', 1 if meeting.get('interviewer_pool') else 0),
+            'attendee_fits': attendee_fits,
+            'availabilities': availabilities,
+        }
+
+    def _feasible(self, plan):
+        """Return (feasible starts mask, pool fits stack or None) under the current bookings."""
+        duration = plan['duration']
+        days = len(self.date_range)
+        starts = len(range(0, max(MINUTES_PER_DAY - duration + 1, 0), self.step_minutes))
+        feasible = np.ones((days, starts), dtype=bool) if plan['attendee_fits'] is None else plan['attendee_fits'].copy()
+        for name in plan['required']:
+            feasible &= self._person_fits(name, duration)
+
+        pool_fits = None
+        if plan['count'] and feasible.any():
+            pool_fits = np.stack([self._person_fits(name, duration) for name in plan['pool']]) if plan['pool'] \
+                else np.zeros((0, days, starts), dtype=bool)
+            feasible &= pool_fits.sum(axis=0) >= plan['count']
+        return feasible, pool_fits
+
+    def _place(self, plan):
+        """Book the best feasible slot for a plan; return the assignment or None."""
+        feasible, pool_fits = self._feasible(plan)
+        day_indices, start_indices = np.nonzero(feasible)
+        if not len(day_indices):
+            return None
+
+        start_minutes = (start_indices * self.step_minutes).astype(np.int32)
+        participants = [self.availabilities[name] for name in plan['required']] + plan['availabilities']
+        scores = self.scoring_model.score_candidates(
+            self.date_range, day_indices, start_minutes, plan['duration'], participants, self.target_timezone
+        )
+        best = int(np.argmax(scores))
+        day_index, start_index = int(day_indices[best]), int(start_indices[best])
+
+        chosen = list(plan['required'])
+        if plan['count']:
+            # Spread the load: pick the least busy pool members free for this slot
+            free_members = [name for name, fits in zip(plan['pool'], pool_fits) if fits[day_index, start_index]]
+            free_members.sort(key=lambda name: (self.total_load[name], self.daily_load[name][day_index]))
+            chosen += free_members[:plan['count']]
+
+        assignment = {
+            'plan': plan,
+            'day_index': day_index,
+            'start': int(start_minutes[best]),
+            'interviewers': chosen,
+            'score': int(scores[best]),
+        }
+        self._book(assignment, True)
+        return assignment
+
+    def _book(self, assignment, booked):
+        """Consume (booked=True) or release the interviewers' time for an assignment."""
+        day_index = assignment['day_index']
+        start = assignment['start']
+        end = start + assignment['plan']['duration']
+        delta = 1 if booked else -1
+        for name in assignment['interviewers']:
+            self.free[name][day_index, start:end] = not booked
+            self.daily_load[name][day_index] += delta
+            self.total_load[name] += delta
+
+    def solve(self, meetings, repair_seconds=2.0):
+        """Schedule all meetings and return (assignments by meeting index, unscheduled indices)."""
+        plans = [self._prepare(meeting) for meeting in meetings]
+
+        # Most constrained first: fewest feasible slots on an empty calendar
+        flexibility = [int(self._feasible(plan)[0].sum()) for plan in plans]
+        order = sorted(range(len(plans)), key=lambda index: flexibility[index])
+
+        assignments = {}
+        unscheduled = []
+        for index in order:
+            assignment = self._place(plans[index])
+            if assignment is None:
+                unscheduled.append(index)
+            else:
+                assignments[index] = assignment
+
+        # Repair: move one meeting that shares an interviewer to make room for a leftover one
+        deadline = time.monotonic() + repair_seconds
+        for index in list(unscheduled):
+            plan = plans[index]
+            people = set(plan['required']) | set(plan['pool'])
+            for other_index, other in list(assignments.items()):
+                if time.monotonic() > deadline:
+                    break
+                if not people.intersection(other['interviewers']):
+                    continue
+                self._book(other, False)
+                placed = self._place(plan)
+                if placed is not None:
+                    moved = self._place(other['plan'])
+                    if moved is not None:
+                        assignments[index] = placed
+                        assignments[other_index] = moved
+                        unscheduled.remove(index)
+                        break
+                    self._book(placed, False)
+                self._book(other, True)
+
+        return assignments, unscheduled
+
+
+def schedule_meetings_batch(batch_input, step_minutes=30, repair_seconds=2.0):
+    """Schedule many meeting requests against a shared interviewer pool in one pass.
+
+    batch_input has the shape:
+        {
+            "interviewers": [attendee dicts with a unique "name", optional "max_meetings_per_day"],
+            "meetings": [{
+                "id": "...",
+                "duration_minutes": 60,
+                "interviewers": ["names that must attend"],
+                "interviewer_pool": ["names to choose from"],
+                "interviewer_count": 1,
+                "attendees": [attendee dicts, e.g. the candidate, that do not use pool capacity]
+            }],
+            "date_range": {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"},
+            "target_timezone": "UTC",
+            "max_meetings_per_day": null
+        }
+    """
+    start_date = datetime.strptime(batch_input['date_range']['start'], '%Y-%m-%d')
+    end_date = datetime.strptime(batch_input['date_range']['end'], '%Y-%m-%d')
+    target_timezone = batch_input.get('target_timezone', "UTC")
+    meetings = batch_input['meetings']
+
+    scheduler = BatchScheduler(
+        batch_input['interviewers'],
+        get_date_range(start_date, end_date),
+        target_timezone,
+        step_minutes,
+        batch_input.get('default_duration_minutes', 60),
+        batch_input.get('max_meetings_per_day'),
+    )
+    assignments, unscheduled = scheduler.solve(meetings, repair_seconds)
+
+    scheduled = []
+    for index in sorted(assignments, key=lambda i: (assignments[i]['day_index'], assignments[i]['start'])):
+        assignment = assignments[index]
+        slot = format_slot(
+            scheduler.date_range[assignment['day_index']],
+            assignment['start'],
+            assignment['plan']['duration'],
+            len(assignment['interviewers']) + len(assignment['plan']['availabilities']),
+            target_timezone,
+        )
+        slot['meeting_id'] = _meeting_key(meetings[index], index)
+        slot['interviewers'] = assignment['interviewers']
+        slot['score'] = assignment['score']
+        scheduled.append(slot)
+
+    return {
+        'scheduled': scheduled,
+        'unscheduled': [_meeting_key(meetings[index], index) for index in sorted(unscheduled)],
+        'timezone': target_timezone,
+    }
@@ -0,0 +1,77 @@
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+# Benchmarks import the flat app modules from the parent directory, with a throwaway cache
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("TIME_SLOTS_CACHE_PATH", os.path.join(tempfile.mkdtemp(), "time_slots.db"))
+
+DAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+PARSE_PROMPT_PATTERN = re.compile(r'Parse the following availability text: "(.*)"')
+
+
+class StubResponse:
+    status_code = 200
+
+    def __init__(self, body):
+        self._body = body
+        self.text = json.dumps(body)
+        self.headers = {}
+
+    def json(self):
+        return self._body
+
+
+class StubClaudeSession:
+    """Stands in for ClaudeClient.session: answers every Messages call locally and counts them.
+
+    Availability parses are answered with parse_result(text); anything else (the
+    preference analysis) gets an empty JSON object. latency_seconds simulates a round trip.
+    """
+
+    def __init__(self, parse_result, latency_seconds=0.0):
+        self.parse_result = parse_result
+        self.latency_seconds = latency_seconds
+        self.parse_calls = 0
+        self.other_calls = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        match = PARSE_PROMPT_PATTERN.search(kwargs["json"]["messages"][0]["content"])
+        with self._lock:
+            if match:
+                self.parse_calls += 1
+            else:
+                self.other_calls += 1
+        result = self.parse_result(match.group(1)) if match else {}
+        return StubResponse({"content": [{"type": "text", "text": f"```json\n{json.dumps(result)}\n```"}]})
+
+
+def install(time_slots, session):
+    """Route the module's Claude client through session and give it a dummy API key.
+
+    The client-side rate limit is lifted: there is no upstream to protect, and back-to-back
+    benchmark runs would otherwise measure the token bucket.
+    """
+    time_slots.set_credential_provider(lambda: "benchmark-key")
+    time_slots.claude_client._session = session
+    time_slots.claude_client.rate_limiter = time_slots.TokenBucket(1e9, 1e9)
+    return session
+
+
+def windows_to_claude_json(windows):
+    """Render [(day, (h, m), (h, m)), ...] as the JSON shape the parsing prompt asks for."""
+    if not windows:
+        return {"days": [], "start_time": {"hour": 9, "minute": 0}, "end_time": {"hour": 17, "minute": 0}}
+    _, start, end = windows[0]
+    return {
+        "days": [DAY_NAMES[day] for day, _, _ in windows],
+        "start_time": {"hour": start[0], "minute": start[1]},
+        "end_time": {"hour": end[0], "minute": end[1]},
+    }
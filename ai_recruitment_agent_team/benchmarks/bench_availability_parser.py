@@ -0,0 +1,128 @@
+"""Accuracy and per-call latency of the local availability grammar and of Claude (user-007).
+
+Scores every case in availability_corpus.json by exact match of the parsed
+(day, start, end) windows, and shows how coverage and precision of the local
+grammar move with the confidence threshold, so LOCAL_PARSER_MIN_CONFIDENCE and
+the grammar's penalty factors can be tuned against data:
+
+    python benchmarks/bench_availability_parser.py           # local grammar only
+    python benchmarks/bench_availability_parser.py --claude  # also call Claude (needs an API key)
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+import _claude_stub  # noqa: F401  (puts the app modules on sys.path with a throwaway cache)
+
+import time_slots
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "availability_corpus.json")
+THRESHOLDS = (0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95)
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path) as f:
+        return json.load(f)["cases"]
+
+
+def expected_windows(case):
+    return {
+        (time_slots.DAY_NAMES.index(day), time_slots.parse_clock(group["start"]), time_slots.parse_clock(group["end"]))
+        for group in case["expected"] for day in group["days"]
+    }
+
+
+def as_windows(availability):
+    return {(day, start[0] * 60 + start[1], end[0] * 60 + end[1]) for day, start, end in availability}
+
+
+def timed(fn, *args, repeat=1):
+    """Return (result, mean seconds per call)."""
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(*args)
+    return result, (time.perf_counter() - started_at) / repeat
+
+
+def latency_summary(seconds, unit, scale):
+    ordered = sorted(seconds)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    return (f"mean {statistics.mean(seconds) * scale:.1f}{unit}, "
+            f"p50 {statistics.median(seconds) * scale:.1f}{unit}, p95 {p95 * scale:.1f}{unit}")
+
+
+def bench_local(cases):
+    results = []
+    for case in cases:
+        (availability, confidence), seconds = timed(time_slots.parse_availability_local, case["text"], repeat=200)
+        results.append({
+            "text": case["text"],
+            "correct": as_windows(availability) == expected_windows(case),
+            "confidence": confidence,
+            "seconds": seconds,
+        })
+
+    total = len(results)
+    correct = sum(result["correct"] for result in results)
+    print(f"Local grammar: {correct}/{total} exact ({correct / total:.0%}), "
+          f"{latency_summary([r['seconds'] for r in results], 'us', 1e6)} per call")
+
+    print(f"\n{'threshold':>9} {'handled locally':>16} {'correct when handled':>21}")
+    for threshold in THRESHOLDS:
+        handled = [result for result in results if result["confidence"] >= threshold]
+        precision = sum(result["correct"] for result in handled) / len(handled) if handled else 0.0
+        marker = "  <- LOCAL_PARSER_MIN_CONFIDENCE" if threshold == time_slots.LOCAL_PARSER_MIN_CONFIDENCE else ""
+        print(f"{threshold:>9.2f} {len(handled):>9}/{total:<6} {precision:>20.0%}{marker}")
+
+    wrong = [result for result in results if not result["correct"]
+             and result["confidence"] >= time_slots.LOCAL_PARSER_MIN_CONFIDENCE]
+    if wrong:
+        print("\nAccepted locally but wrong:")
+        for result in wrong:
+            print(f"  {result['confidence']:.3f}  {result['text']}")
+    return results
+
+
+def bench_claude(cases, local_results):
+    if not time_slots.get_api_key():
+        print(f"\nClaude: skipped, no API key ({time_slots.API_KEY_ENV_VAR} or {time_slots.API_KEY_FILE})")
+        return
+
+    claude_correct = 0
+    hybrid_correct = 0
+    seconds = []
+    for case, local in zip(cases, local_results):
+        try:
+            availability, elapsed = timed(time_slots.parse_availability_with_claude, case["text"])
+            correct = as_windows(availability) == expected_windows(case)
+            seconds.append(elapsed)
+        except Exception as e:
+            print(f"  Claude failed on {case['text']!r}: {e}")
+            correct = False
+        claude_correct += correct
+        # What parse_availability_text returns: local above the threshold, Claude otherwise
+        local_accepted = local["confidence"] >= time_slots.LOCAL_PARSER_MIN_CONFIDENCE
+        hybrid_correct += local["correct"] if local_accepted else correct
+
+    total = len(cases)
+    print(f"\nClaude: {claude_correct}/{total} exact ({claude_correct / total:.0%}), "
+          f"{latency_summary(seconds, 'ms', 1e3) if seconds else 'no successful calls'} per call")
+    print(f"Local first, Claude below {time_slots.LOCAL_PARSER_MIN_CONFIDENCE}: "
+          f"{hybrid_correct}/{total} exact ({hybrid_correct / total:.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--claude", action="store_true", help="Also score the Claude path (makes one API call per case)")
+    args = parser.parse_args()
+
+    cases = load_corpus()
+    local_results = bench_local(cases)
+    if args.claude:
+        bench_claude(cases, local_results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Fallback availability parser throughput on 100k strings, checked against the original (user-008).
+
+Runs the original parse_availability_fallback and the precompiled/memoized one on
+the same inputs, asserts identical output, and reports throughput for all-unique
+strings and for strings drawn from a few hundred phrasings:
+
+    python benchmarks/bench_fallback_parser.py [count]
+"""
+import random
+import re
+import sys
+import time
+
+import _claude_stub  # noqa: F401  (puts the app modules on sys.path with a throwaway cache)
+
+import time_slots
+
+DAY_WORDS = ["monday", "mondays", "mon", "tuesday", "tues", "tue", "wednesday", "weds", "wed", "thursday",
+             "thurs", "thu", "friday", "fri", "saturday", "sat", "sunday", "sun", "Monday", "FRIDAYS"]
+LEADS = ["", "I'm free ", "available ", "Usually ", "every working day ", "all working days, ", "can do "]
+JOINS = [" and ", ", ", " or ", " & "]
+NOISE = ["", " (my time)", " please", " - thanks!", " except holidays", " ref"]
+
+
+def legacy_parse_availability_fallback(availability_text):
+    """parse_availability_fallback as it was before user-008, kept verbatim as the reference."""
+    availability = []
+    
+    # Common patterns
+    days_of_week = {
+        'monday': 0, 'mon': 0, 
+        'tuesday': 1, 'tue': 1, 'tues': 1,
+        'wednesday': 2, 'wed': 2, 'weds': 2,
+        'thursday': 3, 'thu': 3, 'thurs': 3,
+        'friday': 4, 'fri': 4,
+        'saturday': 5, 'sat': 5,
+        'sunday': 6, 'sun': 6
+    }
+    
+    # Extract working days pattern
+    working_days_pattern = re.search(r'(every|all)\s+working\s+day', availability_text.lower())
+    if working_days_pattern:
+        # Working days are Monday-Friday
+        days = [0, 1, 2, 3, 4]
+    else:
+        # Extract specific days
+        days = []
+        for day, code in days_of_week.items():
+            if re.search(fr'\b{day}s?\b', availability_text.lower()):
+                days.append(code)
+    
+    # Extract time range
+    time_pattern = re.search(r'(\d+)(?::(\d+))?\s*(am|pm)\s*to\s*(\d+)(?::(\d+))?\s*(am|pm)', availability_text.lower())
+    if time_pattern:
+        start_hour = int(time_pattern.group(1))
+        start_minute = int(time_pattern.group(2)) if time_pattern.group(2) else 0
+        start_ampm = time_pattern.group(3)
+        
+        end_hour = int(time_pattern.group(4))
+        end_minute = int(time_pattern.group(5)) if time_pattern.group(5) else 0
+        end_ampm = time_pattern.group(6)
+        
+        # Convert to 24-hour format
+        if start_ampm == 'pm' and start_hour < 12:
+            start_hour += 12
+        if start_ampm == 'am' and start_hour == 12:
+            start_hour = 0
+            
+        if end_ampm == 'pm' and end_hour < 12:
+            end_hour += 12
+        if end_ampm == 'am' and end_hour == 12:
+            end_hour = 0
+        
+        start_time = (start_hour, start_minute)
+        end_time = (end_hour, end_minute)
+        
+        # Create availability for each day
+        for day in days:
+            availability.append((day, start_time, end_time))
+    
+    return availability
+
+
+def random_time(rng):
+    hour = rng.randint(1, 12)
+    minute = rng.choice(["", ":00", ":15", ":30", ":45"])
+    return f"{hour}{minute}{rng.choice(['', ' '])}{rng.choice(['am', 'pm'])}"
+
+
+def random_text(rng, serial=None):
+    days = rng.sample(DAY_WORDS, rng.randint(0, 3))
+    text = rng.choice(LEADS) + rng.choice(JOINS).join(days)
+    if rng.random() < 0.9:
+        text += f" {random_time(rng)} to {random_time(rng)}"
+    text += rng.choice(NOISE)
+    if serial is not None:
+        text += f" #{serial}"
+    return text
+
+
+def run(label, texts):
+    started_at = time.perf_counter()
+    expected = [legacy_parse_availability_fallback(text) for text in texts]
+    legacy_seconds = time.perf_counter() - started_at
+
+    time_slots._parse_availability_fallback_cached.cache_clear()
+    started_at = time.perf_counter()
+    actual = [time_slots.parse_availability_fallback(text) for text in texts]
+    current_seconds = time.perf_counter() - started_at
+
+    time_slots._parse_availability_fallback_cached.cache_clear()
+    started_at = time.perf_counter()
+    batched = time_slots.parse_many(texts)
+    batch_seconds = time.perf_counter() - started_at
+
+    assert actual == expected, "parse_availability_fallback differs from the original"
+    assert batched == expected, "parse_many differs from the original"
+    print(f"{label}: {len(texts)} strings, {len(set(texts))} distinct, output identical")
+    for name, seconds in (("original", legacy_seconds), ("current", current_seconds), ("parse_many", batch_seconds)):
+        print(f"  {name:<11} {seconds:7.3f}s  {len(texts) / seconds:>10,.0f}/s  {legacy_seconds / seconds:5.1f}x")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(8)
+    run("all unique", [random_text(rng, serial) for serial in range(count)])
+    phrasings = [random_text(rng) for _ in range(500)]
+    run("500 phrasings", [rng.choice(phrasings) for _ in range(count)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Wall time of one scheduling run when every attendee needs a Claude parse (user-005).
+
+Each attendee has a distinct availability text, so a run makes one parse call per
+attendee plus the preference analysis. With the default concurrency, burst and a
+stubbed round trip of latency seconds, all of them should go out in one wave:
+
+    python benchmarks/bench_fan_out.py [attendees] [latency]
+"""
+import sys
+import time
+
+import _claude_stub
+
+import time_slots
+
+
+def parse_result(text):
+    return _claude_stub.windows_to_claude_json(time_slots.parse_availability_local(text)[0])
+
+
+def main():
+    attendee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    session = _claude_stub.install(time_slots, _claude_stub.StubClaudeSession(parse_result, latency))
+    # Measure the shipped defaults: install() lifts the rate limit, so put the default bucket back
+    time_slots.claude_client.rate_limiter = time_slots.TokenBucket(
+        time_slots.LLM_RATE_LIMIT_PER_SECOND, time_slots.LLM_RATE_LIMIT_BURST
+    )
+    time_slots.LOCAL_PARSER_MIN_CONFIDENCE = float("inf")
+    time_slots.availability_cache.clear()
+
+    attendees = [
+        {"name": f"Attendee {index}", "timezone": "UTC",
+         "availability_text": f"weekdays {8 + index % 4} am to {3 + index % 3} pm (ref {index})"}
+        for index in range(attendee_count)
+    ]
+    started_at = time.perf_counter()
+    time_slots.find_best_meeting_times({
+        "attendees": attendees,
+        "date_range": {"start": "2025-03-03", "end": "2025-03-14"},
+        "target_timezone": "UTC",
+    })
+    seconds = time.perf_counter() - started_at
+
+    calls = session.parse_calls + session.other_calls
+    waves = seconds / latency
+    print(f"{attendee_count} attendees, {calls} Claude calls, concurrency {time_slots.LLM_MAX_CONCURRENCY}, "
+          f"burst {time_slots.LLM_RATE_LIMIT_BURST}, {latency}s per call")
+    print(f"  {seconds:.2f}s wall time, {waves:.1f} round trips")
+    assert session.parse_calls == attendee_count, f"{session.parse_calls} parse calls, expected {attendee_count}"
+    assert waves < 2, f"{calls} calls took {waves:.1f} round trips; the fan-out does not fit one wave"
+
+
+if __name__ == "__main__":
+    main()
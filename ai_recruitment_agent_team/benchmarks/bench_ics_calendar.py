@@ -0,0 +1,44 @@
+"""Reading a large Outlook .ics export for a one-month window (user-017).
+
+Writes a synthetic export with weekly series, Windows timezone names and
+EXDATEs, then times read_busy_intervals cold and again from its cache:
+
+    python benchmarks/bench_ics_calendar.py [events]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+import _claude_stub  # noqa: F401  (puts the app modules on sys.path)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+
+from ics_calendar import read_busy_intervals
+from synthetic_ics import synthetic_calendar
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with tempfile.NamedTemporaryFile("w", suffix=".ics", delete=False) as f:
+        f.write("\r\n".join(synthetic_calendar(events, datetime(2024, 1, 1))) + "\r\n")
+        path = f.name
+    size = os.path.getsize(path)
+    try:
+        window_start, window_end = date(2024, 9, 2), date(2024, 9, 30)
+        started_at = time.perf_counter()
+        starts, _ = read_busy_intervals(path, window_start, window_end)
+        cold_seconds = time.perf_counter() - started_at
+        started_at = time.perf_counter()
+        read_busy_intervals(path, window_start, window_end)
+        warm_seconds = time.perf_counter() - started_at
+    finally:
+        os.unlink(path)
+    print(f"{events} events, {size / 1e6:.1f} MB")
+    print(f"  read and expanded in {cold_seconds:.3f}s ({len(starts)} merged busy intervals in the window)")
+    print(f"  cached re-read: {warm_seconds * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Cold-start cost of "import time_slots" in fresh interpreters (user-020).
+
+Each run starts a new Python process in an empty working directory, imports
+time_slots under an audit hook, and reports the import time together with every
+file open, socket and thread the import caused. The script asserts that the
+import succeeds without api_key.txt, reads no key file, touches no network and
+starts no thread.
+
+With --baseline REV the same measurement runs against the app modules from git
+revision REV (e.g. af6e184^, before the key was resolved lazily). Those need an
+api_key.txt to import at all, so the baseline directory gets a dummy one:
+
+    python benchmarks/bench_import_time.py [--runs 15] [--baseline REV] [--importtime]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_MODULES = ["time_slots.py", "disk_cache.py", "ics_calendar.py"]
+
+# urllib3 binds a local socket at import to probe for IPv6; only these would mean network traffic
+NETWORK_EVENTS = {"socket.connect", "socket.getaddrinfo", "socket.gethostbyname", "socket.sendto", "socket.sendmsg"}
+
+# Runs in the child: records what the import touches, then prints it as JSON
+CHILD = r"""
+import json, sys, threading, time
+events = {"open": [], "socket": []}
+def hook(event, args):
+    if event == "open" and isinstance(args[0], str):
+        events["open"].append(args[0])
+    elif event.startswith("socket."):
+        events["socket"].append(event)
+sys.addaudithook(hook)
+started_at = time.perf_counter()
+import time_slots
+events["seconds"] = time.perf_counter() - started_at
+events["threads"] = threading.active_count()
+print(json.dumps(events))
+"""
+
+
+def run_import(app_dir, workdir, importtime=False):
+    env = dict(os.environ, PYTHONPATH=app_dir, TIME_SLOTS_CACHE_PATH=os.path.join(workdir, "time_slots.db"))
+    env.pop("ANTHROPIC_API_KEY", None)
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", CHILD]
+    completed = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise SystemExit(f"import time_slots failed in {app_dir}:\n{completed.stderr}")
+    return json.loads(completed.stdout.splitlines()[-1]), completed.stderr
+
+
+def export_revision(revision, target):
+    for name in APP_MODULES:
+        source = subprocess.run(["git", "show", f"{revision}:./{name}"], cwd=APP_DIR,
+                                capture_output=True, text=True, check=True).stdout
+        with open(os.path.join(target, name), "w") as handle:
+            handle.write(source)
+
+
+def slowest_imports(stderr, count=8):
+    """Slowest top-level imports and their direct imports (by cumulative time) from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented two spaces per level under the module that triggered them
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth <= 1:
+            rows.append((int(cumulative_us), int(self_us), "  " * depth + name.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def measure(label, app_dir, runs, importtime):
+    with tempfile.TemporaryDirectory() as workdir:
+        if app_dir != APP_DIR:
+            with open(os.path.join(workdir, "api_key.txt"), "w") as handle:
+                handle.write("sk-ant-dummy\n")
+        results = [run_import(app_dir, workdir)[0] for _ in range(runs)]
+        trace = run_import(app_dir, workdir, importtime=True)[1] if importtime else ""
+        leftovers = sorted(set(os.listdir(workdir)) - {"api_key.txt"})
+
+    seconds = sorted(result["seconds"] for result in results)
+    opened = sorted({os.path.basename(path) for result in results for path in result["open"]
+                     if not path.endswith((".py", ".pyc", ".so", ".pth")) and not os.path.isdir(path)})
+    sockets = sorted({event for result in results for event in result["socket"]})
+    threads = max(result["threads"] for result in results)
+    print(f"{label}: {runs} runs, median {statistics.median(seconds):.3f}s, "
+          f"min {seconds[0]:.3f}s, max {seconds[-1]:.3f}s")
+    print(f"  files opened: {opened or 'none'}; sockets: {sockets or 'none'}; threads: {threads}; "
+          f"files left in cwd: {leftovers or 'none'}")
+    for cumulative_us, self_us, name in slowest_imports(trace):
+        print(f"    {name:<28} {cumulative_us / 1e6:6.3f}s cumulative")
+    return opened, sockets, threads, leftovers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--baseline", help="git revision to compare against, e.g. af6e184^")
+    parser.add_argument("--importtime", action="store_true", help="list the slowest top-level imports")
+    args = parser.parse_args()
+
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as baseline_dir:
+            export_revision(args.baseline, baseline_dir)
+            measure(f"baseline {args.baseline}", baseline_dir, args.runs, args.importtime)
+
+    opened, sockets, threads, leftovers = measure("current", APP_DIR, args.runs, args.importtime)
+    assert not [name for name in opened if "api_key" in name], f"import read a key file: {opened}"
+    assert not NETWORK_EVENTS.intersection(sockets), f"import touched the network: {sockets}"
+    assert threads == 1, f"import started {threads - 1} thread(s)"
+    assert not leftovers, f"import created files in the working directory: {leftovers}"
+    print("current: imports without api_key.txt; no key file read, network access, thread or file created")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Claude parse calls per scheduling run as the date range grows (user-001).
+
+Each distinct availability text must be parsed once per run, however many days are
+scheduled. Claude is stubbed, so this runs offline:
+
+    python benchmarks/bench_parse_calls.py
+"""
+import time
+from datetime import date, timedelta
+
+import _claude_stub
+
+import time_slots
+
+TEXTS = [
+    "every working day 2 pm to 5 pm",
+    "Mondays and Tuesdays between 8 am to 3 pm",
+    "weekdays 9am-1pm",
+    "Tuesday, Wednesday and Thursday 10:00-16:00",
+    "Friday 1 pm to 6 pm",
+]
+TIMEZONES = ["Asia/Kolkata", "America/New_York", "Europe/Berlin"]
+
+
+def parse_result(text):
+    # Answer with what the local grammar reads, so the schedule looks realistic
+    return _claude_stub.windows_to_claude_json(time_slots.parse_availability_local(text)[0])
+
+
+def main():
+    session = _claude_stub.install(time_slots, _claude_stub.StubClaudeSession(parse_result))
+    # Send every text to Claude so the count measures LLM calls, not local-grammar hits
+    time_slots.LOCAL_PARSER_MIN_CONFIDENCE = float("inf")
+
+    attendees = [
+        {"name": f"Attendee {index}", "availability_text": TEXTS[index % len(TEXTS)],
+         "timezone": TIMEZONES[index // len(TEXTS) % len(TIMEZONES)]}
+        for index in range(20)
+    ]
+    distinct = len({(a["availability_text"], a["timezone"]) for a in attendees})
+
+    print(f"{len(attendees)} attendees, {distinct} distinct (text, timezone) pairs")
+    # The original loop parsed every attendee's text once per scheduled date
+    print(f"{'days':>5} {'parse calls':>12} {'per-date parsing':>17} {'seconds':>8}")
+    for days in (7, 30, 90, 365):
+        time_slots.availability_cache.clear()
+        session.parse_calls = 0
+        start = date(2025, 3, 3)
+        started_at = time.perf_counter()
+        time_slots.find_best_meeting_times({
+            "attendees": attendees,
+            "date_range": {"start": start.isoformat(), "end": (start + timedelta(days=days - 1)).isoformat()},
+            "target_timezone": "UTC",
+        })
+        seconds = time.perf_counter() - started_at
+        print(f"{days:>5} {session.parse_calls:>12} {len(attendees) * days:>17} {seconds:>8.3f}")
+        assert session.parse_calls == distinct, f"{session.parse_calls} parse calls for {days} days, expected {distinct}"
+
+
+if __name__ == "__main__":
+    main()
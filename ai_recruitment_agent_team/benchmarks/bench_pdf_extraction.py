@@ -0,0 +1,57 @@
+"""Resume/JD text extraction throughput: original loop vs the process pool (user-022).
+
+Extracts copies of the two sample PDFs with the original single-threaded
+PyPDF2 loop and with PdfExtractionService.extract_many, asserts identical text,
+and reports documents per second and the median per-document latency:
+
+    python benchmarks/bench_pdf_extraction.py [copies]
+"""
+import io
+import os
+import sys
+import time
+
+import _claude_stub  # noqa: F401  (puts the app modules on sys.path)
+
+import PyPDF2
+
+from pdf_extraction import PdfExtractionService, read_pdf_bytes
+
+SAMPLES = ["Pradeep_Data_Engineer_6+.pdf", "JD - Data Engineer (WFH).pdf"]
+
+
+def legacy_extract(source):
+    """The original extract_text_from_pdf loop, kept as the reference."""
+    pdf_reader = PyPDF2.PdfReader(source)
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text()
+    return text
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    documents = [read_pdf_bytes(os.path.join(app_dir, name)) for name in SAMPLES] * copies
+
+    started_at = time.perf_counter()
+    legacy_texts = [legacy_extract(io.BytesIO(data)) for data in documents]
+    legacy_seconds = time.perf_counter() - started_at
+
+    service = PdfExtractionService()
+    service.extract(documents[0])  # Start the workers outside the timed run
+    started_at = time.perf_counter()
+    results = list(service.extract_many(documents))
+    pooled_seconds = time.perf_counter() - started_at
+    service.shutdown()
+
+    assert [result["text"] for result in results] == legacy_texts, "extracted text differs from the legacy loop"
+    per_document = sorted(result["seconds"] for result in results)
+    print(f"{len(documents)} documents, {service.max_workers} workers, text identical")
+    print(f"  legacy loop:  {legacy_seconds:.2f}s ({len(documents) / legacy_seconds:.1f} docs/s)")
+    print(f"  process pool: {pooled_seconds:.2f}s ({len(documents) / pooled_seconds:.1f} docs/s), "
+          f"median per document {per_document[len(per_document) // 2]:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""SchedulingSession init and update_attendee cost on a large panel, checked against full re-runs (user-015).
+
+A 50-person panel over 92 days with weekly meetings, scored with the buffer,
+comfort and fairness components switched on. Times a full find_best_meeting_times,
+the session's initial build, single-attendee updates, and a scoring-config hot
+reload, asserting after each step that the session ranks exactly like a full
+re-run. Claude is stubbed, so this runs offline:
+
+    python benchmarks/bench_scheduling_session.py [attendees] [days]
+"""
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import _claude_stub
+
+import time_slots
+
+TEXTS = [
+    "every working day 8 am to 6 pm",
+    "weekdays 9am-5pm",
+    "Mondays to Thursdays 7 am to 4 pm",
+    "every working day 10 am to 7 pm",
+]
+TIMEZONES = ["America/New_York", "Europe/London", "Europe/Berlin", "Asia/Kolkata", "UTC"]
+CONFIG = {"buffer": {"score": -5}, "attendee_comfort": {"score": -2}, "fairness": {"mode": "sum"}}
+
+
+def attendee(index):
+    return {
+        "name": f"Attendee {index}",
+        "availability_text": TEXTS[index % len(TEXTS)],
+        "timezone": TIMEZONES[index % len(TIMEZONES)],
+        "teams_calendar": [
+            {"day": index % 5, "start": (9 + index % 6, 0), "end": (10 + index % 6, 0)},
+            {"day": (index + 2) % 5, "start": (13, 30), "end": (14, 15)},
+        ],
+    }
+
+
+def write_config(path, config):
+    with open(path, "w") as f:
+        json.dump(config, f)
+    # Make sure the hot reload sees a new mtime even on coarse-grained filesystems
+    stamp = time.time_ns() + 10 ** 9
+    os.utime(path, ns=(stamp, stamp))
+
+
+def timed(function, *args):
+    started_at = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started_at
+
+
+def check(session, input_data, label):
+    expected = time_slots.find_best_meeting_times(input_data)
+    assert expected["best_meeting_times"], "the panel has no slots, so there is nothing to compare"
+    assert session.best_meeting_times() == expected, f"session differs from a full re-run after {label}"
+
+
+def main():
+    attendee_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    day_count = int(sys.argv[2]) if len(sys.argv) > 2 else 92
+    _claude_stub.install(time_slots, _claude_stub.StubClaudeSession(lambda text: {}))
+    config_path = os.path.join(tempfile.mkdtemp(), "scoring.json")
+    write_config(config_path, CONFIG)
+    time_slots.SCORING_CONFIG_PATH = config_path
+
+    start = date(2026, 1, 5)
+    input_data = {
+        "attendees": [attendee(index) for index in range(attendee_count)],
+        "date_range": {"start": start.isoformat(), "end": (start + timedelta(days=day_count - 1)).isoformat()},
+        "target_timezone": "America/New_York",
+        "min_attendees": attendee_count // 2,
+    }
+
+    _, full_seconds = timed(time_slots.find_best_meeting_times, input_data)
+    session, init_seconds = timed(time_slots.SchedulingSession, input_data)
+    check(session, input_data, "init")
+    print(f"{attendee_count} attendees x {day_count} days, config {CONFIG}")
+    print(f"  find_best_meeting_times   {full_seconds * 1000:8.1f} ms")
+    print(f"  session init              {init_seconds * 1000:8.1f} ms")
+
+    # A positive recency weight favours later days, so a session that kept stale scores would rank differently
+    write_config(config_path, dict(CONFIG, recency={"score_per_day": 5}))
+    _, reload_seconds = timed(session.best_meeting_times)
+    check(session, input_data, "a config reload")
+    print(f"  re-rank after reload      {reload_seconds * 1000:8.1f} ms")
+
+    # Move one weekly meeting: only the days of the old and new weekday change
+    updated = copy.deepcopy(input_data)
+    moved = updated["attendees"][7]
+    moved["teams_calendar"][0] = {"day": 4, "start": (15, 0), "end": (16, 30)}
+    changed_days, update_seconds = timed(session.update_attendee, moved)
+    check(session, updated, "update_attendee")
+    print(f"  update_attendee (meeting) {update_seconds * 1000:8.1f} ms, {len(changed_days)} days recomputed")
+
+    moved = updated["attendees"][8]
+    moved["timezone"] = "Asia/Tokyo"
+    changed_days, update_seconds = timed(session.update_attendee, moved)
+    check(session, updated, "a timezone change")
+    print(f"  update_attendee (timezone){update_seconds * 1000:8.1f} ms, {len(changed_days)} days recomputed")
+    print("session output matched a full re-run after every step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Timezone conversion micro-benchmark, checked against the original (user-009).
+
+Converts the same random (day, start, end) windows with the original per-window
+pytz localize/astimezone path and with the memoized offset tables, asserts
+identical output for anchor weeks that include DST transitions, and reports the
+time for single-window calls and for one bulk call per (source, target, anchor).
+Cold runs build every offset table and warm runs reuse them; the "spread" case has
+only a few dozen windows per table, the "scheduling run" case looks like one panel:
+
+    python benchmarks/bench_timezone_conversion.py [windows]
+"""
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import pytz
+
+import _claude_stub  # noqa: F401  (puts the app modules on sys.path with a throwaway cache)
+
+import time_slots
+
+TIMEZONES = ["UTC", "America/New_York", "America/Los_Angeles", "Europe/London", "Europe/Berlin",
+             "Asia/Kolkata", "Asia/Tokyo", "Australia/Sydney", "Pacific/Chatham"]
+
+# Ordinary weeks plus the weeks of the 2026 US, EU and southern-hemisphere DST switches
+ANCHORS = [date(2026, 1, 12), date(2026, 3, 6), date(2026, 3, 27), date(2026, 4, 3),
+           date(2026, 9, 25), date(2026, 10, 23), date(2026, 10, 30)]
+
+
+def legacy_get_timezone(timezone_str):
+    """get_timezone as it was before user-009 (no memoization)."""
+    if not timezone_str:
+        return pytz.UTC
+    tz_name = time_slots.TIMEZONE_MAPPING.get(timezone_str)
+    if tz_name:
+        return pytz.timezone(tz_name)
+    try:
+        return pytz.timezone(timezone_str)
+    except pytz.exceptions.UnknownTimeZoneError:
+        return pytz.UTC
+
+
+def legacy_convert_to_target_timezone(day_of_week, start_time, end_time, source_tz, target_tz, as_of):
+    """convert_to_target_timezone as it was before user-009, kept verbatim as the reference.
+
+    The only change is that datetime.now() is replaced by as_of so runs are reproducible.
+    """
+    # Create a datetime object for next occurrence of the day of week
+    now = as_of
+    days_ahead = day_of_week - now.weekday()
+    if days_ahead < 0:  # Target day already happened this week
+        days_ahead += 7
+
+    # Create source datetime objects
+    source_date = now + timedelta(days=days_ahead)
+    source_start_dt = datetime.combine(source_date, datetime.min.time().replace(
+        hour=start_time[0], minute=start_time[1]
+    ))
+    source_end_dt = datetime.combine(source_date, datetime.min.time().replace(
+        hour=end_time[0], minute=end_time[1]
+    ))
+
+    # Localize to source timezone
+    source_tz = legacy_get_timezone(source_tz)
+    source_start_dt = source_tz.localize(source_start_dt)
+    source_end_dt = source_tz.localize(source_end_dt)
+
+    # Convert to target timezone
+    target_tz = legacy_get_timezone(target_tz)
+    target_start_dt = source_start_dt.astimezone(target_tz)
+    target_end_dt = source_end_dt.astimezone(target_tz)
+
+    # Extract day, hour, and minute
+    target_day = target_start_dt.weekday()
+    target_start_time = (target_start_dt.hour, target_start_dt.minute)
+    target_end_time = (target_end_dt.hour, target_end_dt.minute)
+
+    # Handle day change
+    if target_start_dt.date() != target_end_dt.date():
+        # If time spans midnight, return two separate slots
+        return [
+            (target_day, target_start_time, (23, 59)),
+            ((target_day + 1) % 7, (0, 0), target_end_time)
+        ]
+
+    return [(target_day, target_start_time, target_end_time)]
+
+
+def random_window(rng):
+    start = rng.randrange(0, 23 * 60, 15)
+    end = rng.randrange(start + 15, 24 * 60, 15)
+    return rng.randrange(7), divmod(start, 60), divmod(end, 60)
+
+
+def random_jobs(rng, count, sources, targets, anchors):
+    """(window, source, target, anchor) tuples."""
+    return [(random_window(rng), rng.choice(sources), rng.choice(targets), rng.choice(anchors))
+            for _ in range(count)]
+
+
+def convert_single(jobs):
+    return [time_slots.convert_to_target_timezone(*window, source, target, as_of=anchor)
+            for window, source, target, anchor in jobs]
+
+
+def convert_bulk(groups, count):
+    """One convert_windows_to_target_timezone call per (source, target, anchor), results back in job order."""
+    results = [None] * count
+    for (source, target, anchor), members in groups.items():
+        converted = time_slots.convert_windows_to_target_timezone([window for _, window in members],
+                                                                  source, target, anchor)
+        # A window yields two slots only when it now spans midnight, i.e. the second starts at (0, 0)
+        position = 0
+        for index, _ in members:
+            width = 2 if position + 1 < len(converted) and converted[position][2] == (23, 59) \
+                and converted[position + 1][1] == (0, 0) else 1
+            results[index] = converted[position:position + width]
+            position += width
+    return results
+
+
+def timed(function, *args):
+    started_at = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started_at
+
+
+def clear_caches():
+    time_slots.get_timezone.cache_clear()
+    time_slots.timezone_offset_table.cache_clear()
+
+
+def run(label, jobs):
+    count = len(jobs)
+    groups = {}
+    for index, (window, source, target, anchor) in enumerate(jobs):
+        groups.setdefault((source, target, anchor), []).append((index, window))
+
+    expected, legacy_seconds = timed(lambda: [legacy_convert_to_target_timezone(*window, source, target, anchor)
+                                              for window, source, target, anchor in jobs])
+    clear_caches()
+    single, single_cold = timed(convert_single, jobs)
+    _, single_warm = timed(convert_single, jobs)
+    clear_caches()
+    bulk, bulk_cold = timed(convert_bulk, groups, count)
+    _, bulk_warm = timed(convert_bulk, groups, count)
+
+    assert single == expected, "convert_to_target_timezone differs from the original"
+    assert bulk == expected, "convert_windows_to_target_timezone differs from the original"
+    print(f"{label}: {count} windows, {len(groups)} offset tables, output identical")
+    for name, seconds in (("original", legacy_seconds), ("single cold", single_cold), ("single warm", single_warm),
+                          ("bulk cold", bulk_cold), ("bulk warm", bulk_warm)):
+        print(f"  {name:<11} {seconds:7.3f}s  {count / seconds:>10,.0f}/s  {legacy_seconds / seconds:5.1f}x")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(9)
+    run(f"spread ({len(TIMEZONES)} x {len(TIMEZONES)} timezones, {len(ANCHORS)} anchor weeks)",
+        random_jobs(rng, count, TIMEZONES, TIMEZONES, ANCHORS))
+    # Five attendee timezones into one target over a month, as a 30-day scheduling run does
+    run("scheduling run (5 timezones -> America/New_York, 4 weeks)",
+        random_jobs(rng, count, TIMEZONES[3:8], ["America/New_York"], ANCHORS[2:6]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import argparse
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from ai_recruitment_agent_team import (
+    ROLE_REQUIREMENTS,
+    analyze_resume_details,
+    create_resume_analyzer,
+    extract_text_from_pdf,
+)
+
+
+def iter_resume_paths(source: str) -> Iterator[str]:
+    """Yield PDF paths from a directory (sorted) or from a manifest file with one path per line."""
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.lower().endswith(".pdf"):
+                yield os.path.join(source, name)
+        return
+
+    base_dir = os.path.dirname(os.path.abspath(source))
+    with open(source) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                # Relative manifest entries are relative to the manifest itself
+                yield line if os.path.isabs(line) else os.path.join(base_dir, line)
+
+
+def load_processed(output_path: str, role: str) -> Set[str]:
+    """Return the paths already screened successfully for a role in an existing output file."""
+    processed = set()
+    if not os.path.exists(output_path):
+        return processed
+    with open(output_path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write can leave a truncated last line
+                continue
+            if record.get("status") == "ok" and record.get("role") == role:
+                processed.add(record["path"])
+    return processed
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values (0.0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def screen_resumes(
+    paths: Iterable[str],
+    role: str,
+    output_path: str,
+    api_key: str,
+    max_workers: int = 4,
+) -> Dict:
+    """Screen resumes concurrently, appending a JSON line per resume as soon as it finishes.
+
+    At most 2 * max_workers resumes are in flight, so memory stays flat however long
+    the input is. Returns a summary with throughput and latency percentiles.
+    """
+    if role not in ROLE_REQUIREMENTS:
+        raise ValueError(f"Unknown role {role}; expected one of {', '.join(ROLE_REQUIREMENTS)}")
+
+    processed = load_processed(output_path, role)
+    # Agents keep per-run state, so each worker thread gets its own analyzer rather than the shared one
+    local = threading.local()
+
+    def screen_one(path: str) -> Dict:
+        started_at = time.perf_counter()
+        record = {"path": path, "role": role}
+        try:
+            if not hasattr(local, "analyzer"):
+                local.analyzer = create_resume_analyzer(api_key, reuse=False)
+            resume_text = extract_text_from_pdf(path)
+            if not resume_text:
+                raise ValueError("No text could be extracted from the PDF")
+            extracted_at = time.perf_counter()
+            record["analysis"] = analyze_resume_details(resume_text, role, local.analyzer)
+            record["status"] = "ok"
+            record["extract_seconds"] = round(extracted_at - started_at, 3)
+        except Exception as e:
+            record["status"] = "error"
+            record["error"] = f"{type(e).__name__}: {e}"
+        record["seconds"] = round(time.perf_counter() - started_at, 3)
+        return record
+
+    latencies = []
+    counts = {"ok": 0, "error": 0, "skipped": 0}
+    started_at = time.perf_counter()
+
+    def write(futures, out) -> None:
+        for future in futures:
+            record = future.result()
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            counts[record["status"]] += 1
+            latencies.append(record["seconds"])
+            print(f"[{record['status']}] {record['path']} ({record['seconds']:.1f}s)")
+
+    with open(output_path, "a") as out, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for path in paths:
+            if path in processed:
+                counts["skipped"] += 1
+                continue
+            if len(pending) >= 2 * max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                write(done, out)
+            pending.add(executor.submit(screen_one, path))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            write(done, out)
+
+    elapsed = time.perf_counter() - started_at
+    screened = counts["ok"] + counts["error"]
+    return {
+        **counts,
+        "elapsed_seconds": round(elapsed, 2),
+        "resumes_per_minute": round(screened / elapsed * 60, 2) if elapsed > 0 else 0.0,
+        "p50_seconds": percentile(latencies, 0.50),
+        "p95_seconds": percentile(latencies, 0.95),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Screen a batch of resumes against a role without the UI.")
+    parser.add_argument("source", help="Directory of PDFs, or a manifest file with one PDF path per line")
+    parser.add_argument("--role", required=True, choices=sorted(ROLE_REQUIREMENTS))
+    parser.add_argument("--output", default="screening_results.jsonl", help="JSONL file to append results to")
+    parser.add_argument("--workers", type=int, default=4, help="Resumes screened concurrently")
+    parser.add_argument("--api-key", default=os.environ.get("OPENAI_API_KEY"),
+                        help="OpenAI API key (defaults to $OPENAI_API_KEY)")
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        parser.error("an OpenAI API key is required (--api-key or OPENAI_API_KEY)")
+
+    summary = screen_resumes(iter_resume_paths(args.source), args.role, args.output, args.api_key, args.workers)
+    print(
+        f"Screened {summary['ok'] + summary['error']} resumes ({summary['ok']} ok, {summary['error']} failed, "
+        f"{summary['skipped']} skipped) in {summary['elapsed_seconds']}s: "
+        f"{summary['resumes_per_minute']} resumes/min, p50 {summary['p50_seconds']}s, p95 {summary['p95_seconds']}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
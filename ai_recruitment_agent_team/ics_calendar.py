@@ -0,0 +1,364 @@
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+import os
+
+import numpy as np
+import pytz
+from dateutil.rrule import rrulestr
+
+# Timezone names written by Outlook/Exchange exports instead of IANA names
+WINDOWS_TIMEZONES = {
+    "UTC": "Etc/UTC",
+    "GMT Standard Time": "Europe/London",
+    "Greenwich Standard Time": "Atlantic/Reykjavik",
+    "W. Europe Standard Time": "Europe/Berlin",
+    "Central Europe Standard Time": "Europe/Budapest",
+    "Romance Standard Time": "Europe/Paris",
+    "Central European Standard Time": "Europe/Warsaw",
+    "E. Europe Standard Time": "Europe/Chisinau",
+    "FLE Standard Time": "Europe/Kiev",
+    "Russian Standard Time": "Europe/Moscow",
+    "Arabian Standard Time": "Asia/Dubai",
+    "India Standard Time": "Asia/Kolkata",
+    "China Standard Time": "Asia/Shanghai",
+    "Singapore Standard Time": "Asia/Singapore",
+    "Tokyo Standard Time": "Asia/Tokyo",
+    "AUS Eastern Standard Time": "Australia/Sydney",
+    "Eastern Standard Time": "America/New_York",
+    "Central Standard Time": "America/Chicago",
+    "Mountain Standard Time": "America/Denver",
+    "US Mountain Standard Time": "America/Phoenix",
+    "Pacific Standard Time": "America/Los_Angeles",
+    "Alaskan Standard Time": "America/Anchorage",
+    "Hawaiian Standard Time": "Pacific/Honolulu",
+    "E. South America Standard Time": "America/Sao_Paulo",
+}
+
+DURATION_PATTERN = re.compile(
+    r"([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+)
+UNTIL_PATTERN = re.compile(r"UNTIL=(\d{8}(?:T\d{6}Z?)?)")
+FREQ_PATTERN = re.compile(r"FREQ=(\w+)")
+INTERVAL_PATTERN = re.compile(r"INTERVAL=(\d+)")
+
+# Days per period of the frequencies whose expansion can start from any whole period
+FIXED_PERIOD_DAYS = {"DAILY": 1, "WEEKLY": 7}
+
+# Events a calendar marks as not blocking time
+FREE_STATUSES = {"CANCELLED"}
+
+# The only VEVENT properties the reader needs; everything else (descriptions, attendees) is skipped unparsed
+EVENT_PROPERTIES = {
+    "DTSTART", "DTEND", "DURATION", "RRULE", "RDATE", "EXDATE", "RECURRENCE-ID", "UID", "STATUS", "TRANSP",
+}
+_EVENT_PROPERTY_PREFIXES = tuple(EVENT_PROPERTIES)
+
+EPOCH = datetime(1970, 1, 1)
+
+
+@lru_cache(maxsize=256)
+def resolve_timezone(tzid):
+    """Return the pytz timezone for an iCalendar TZID, or None if it is unknown."""
+    tzid = WINDOWS_TIMEZONES.get(tzid, tzid)
+    try:
+        return pytz.timezone(tzid)
+    except pytz.UnknownTimeZoneError:
+        pass
+    # Some exporters prefix IANA names, e.g. /freeassociation.sourceforge.net/Europe/Berlin
+    parts = tzid.strip("/").split("/")
+    for size in (3, 2):
+        if len(parts) >= size:
+            try:
+                return pytz.timezone("/".join(parts[-size:]))
+            except pytz.UnknownTimeZoneError:
+                continue
+    print(f"Unknown calendar timezone {tzid}, treating it as floating time")
+    return None
+
+
+def unfold_lines(lines):
+    """Yield logical content lines, joining RFC 5545 folded continuation lines."""
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def parse_content_line(line):
+    """Split a content line into (NAME, {PARAM: value}, value)."""
+    colon = line.find(":")
+    if '"' in line[:colon]:
+        # A quoted parameter value may itself contain a colon
+        in_quotes = False
+        for colon, char in enumerate(line):
+            if char == '"':
+                in_quotes = not in_quotes
+            elif char == ":" and not in_quotes:
+                break
+    head, value = line[:colon], line[colon + 1:]
+    name, _, param_text = head.partition(";")
+    params = {}
+    if param_text:
+        for param in param_text.split(";"):
+            key, _, param_value = param.partition("=")
+            params[key.upper()] = param_value.strip('"')
+    return name.upper(), params, value
+
+
+def parse_ics_datetime(value, params, default_tz):
+    """Parse a DATE or DATE-TIME value into (naive wall-clock datetime, timezone, is_all_day)."""
+    value = value.strip()
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return datetime(int(value[:4]), int(value[4:6]), int(value[6:8])), default_tz, True
+
+    local = datetime(
+        int(value[:4]), int(value[4:6]), int(value[6:8]),
+        int(value[9:11]), int(value[11:13]), int(value[13:15])
+    )
+    if value.endswith("Z"):
+        return local, pytz.utc, False
+    tzid = params.get("TZID")
+    tz = resolve_timezone(tzid) if tzid else None
+    return local, tz or default_tz, False
+
+
+def to_epoch(local, tz):
+    """Seconds since the epoch for a wall-clock datetime in tz (DST gaps resolve forward)."""
+    if tz is pytz.utc:
+        return int((local - EPOCH).total_seconds())
+    # Offsets only change on whole hours, so localizing the hour once serves every event in it
+    return _hour_epoch(tz, local.replace(minute=0, second=0, microsecond=0)) + local.minute * 60 + local.second
+
+
+@lru_cache(maxsize=65536)
+def _hour_epoch(tz, hour_start):
+    return int(tz.localize(hour_start).timestamp())
+
+
+def parse_duration(value):
+    """Parse an RFC 5545 DURATION value into a timedelta."""
+    match = DURATION_PATTERN.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid duration {value!r}")
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    delta = timedelta(
+        weeks=int(weeks or 0), days=int(days or 0),
+        hours=int(hours or 0), minutes=int(minutes or 0), seconds=int(seconds or 0)
+    )
+    return -delta if sign == "-" else delta
+
+
+def iter_vevents(lines):
+    """Stream VEVENT components as {NAME: [(params, value), ...]} dicts, skipping everything else."""
+    event = None
+    depth = 0
+    for line in unfold_lines(lines):
+        if line.startswith("BEGIN:"):
+            if event is not None:
+                # Nested components such as VALARM
+                depth += 1
+            elif line == "BEGIN:VEVENT":
+                event = {}
+            continue
+        if line.startswith("END:"):
+            if depth:
+                depth -= 1
+            elif line == "END:VEVENT" and event is not None:
+                yield event
+                event = None
+            continue
+        if event is None or depth or not line.startswith(_EVENT_PROPERTY_PREFIXES):
+            continue
+        name, params, value = parse_content_line(line)
+        if name in EVENT_PROPERTIES:
+            event.setdefault(name, []).append((params, value))
+
+
+def _first(event, name):
+    values = event.get(name)
+    return values[0] if values else (None, None)
+
+
+def _date_list_epochs(event, name, default_tz):
+    """Epochs of every date in EXDATE/RDATE style properties (comma-separated, possibly repeated)."""
+    epochs = []
+    for params, value in event.get(name, []):
+        for item in value.split(","):
+            if item:
+                local, tz, _ = parse_ics_datetime(item, params, default_tz)
+                epochs.append(to_epoch(local, tz))
+    return epochs
+
+
+def _localize_until(rule, tz):
+    """Rewrite a UTC UNTIL into tz wall-clock time, since recurrences are expanded in wall-clock time."""
+    match = UNTIL_PATTERN.search(rule)
+    if not match or not match.group(1).endswith("Z"):
+        return rule
+    until, _, _ = parse_ics_datetime(match.group(1), {}, pytz.utc)
+    if tz is not pytz.utc:
+        until = pytz.utc.localize(until).astimezone(tz).replace(tzinfo=None)
+    return rule[:match.start(1)] + until.strftime("%Y%m%dT%H%M%S") + rule[match.end(1):]
+
+
+@lru_cache(maxsize=4096)
+def parse_rrule(rule):
+    """Parse an RRULE value once; callers bind it to an event with .replace(dtstart=...)."""
+    return rrulestr(rule, dtstart=EPOCH)
+
+
+def skip_to_window(rule, start, window_start):
+    """Move a DAILY/WEEKLY start forward by whole periods so expansion does not replay years of history.
+
+    COUNT-limited rules and other frequencies are returned unchanged.
+    """
+    freq = FREQ_PATTERN.search(rule)
+    if "COUNT=" in rule or not freq or freq.group(1) not in FIXED_PERIOD_DAYS:
+        return start
+    interval = INTERVAL_PATTERN.search(rule)
+    period = timedelta(days=FIXED_PERIOD_DAYS[freq.group(1)] * int(interval.group(1) if interval else 1))
+    periods = (window_start - start) // period
+    return start + (periods - 1) * period if periods > 1 else start
+
+
+def iter_busy_intervals(lines, start_date, end_date, default_timezone="UTC"):
+    """Stream (start, end) epoch-second busy intervals overlapping start_date..end_date from .ics lines.
+
+    The window is widened by a day on each side so that every timezone's view of the
+    requested dates is covered. Recurrences are expanded only inside the window, honouring
+    EXDATE, RDATE and RECURRENCE-ID overrides. Floating times use default_timezone.
+    """
+    default_tz = resolve_timezone(default_timezone) or pytz.utc
+    window_start = datetime(start_date.year, start_date.month, start_date.day) - timedelta(days=1)
+    window_end = datetime(end_date.year, end_date.month, end_date.day) + timedelta(days=2)
+    # Wall-clock prefilter bounds; UTC offsets never exceed 14 hours
+    local_start = window_start - timedelta(days=1)
+    local_end = window_end + timedelta(days=1)
+    epoch_start = to_epoch(window_start, pytz.utc)
+    epoch_end = to_epoch(window_end, pytz.utc)
+
+    # Masters are expanded at the end, once every RECURRENCE-ID override has been seen
+    recurring = []
+    overridden = set()
+
+    for event in iter_vevents(lines):
+        status = _first(event, "STATUS")[1]
+        transparency = _first(event, "TRANSP")[1]
+        uid = _first(event, "UID")[1]
+
+        params, value = _first(event, "RECURRENCE-ID")
+        if value is not None:
+            local, tz, _ = parse_ics_datetime(value, params, default_tz)
+            overridden.add((uid, to_epoch(local, tz)))
+
+        if status in FREE_STATUSES or transparency == "TRANSPARENT":
+            continue
+
+        params, value = _first(event, "DTSTART")
+        if value is None:
+            continue
+        start, tz, all_day = parse_ics_datetime(value, params, default_tz)
+
+        end_params, end_value = _first(event, "DTEND")
+        if end_value is not None:
+            end, end_tz, _ = parse_ics_datetime(end_value, end_params, default_tz)
+            if end_tz is not tz:
+                end = end + timedelta(seconds=to_epoch(end, end_tz) - to_epoch(end, tz))
+            duration = end - start
+        elif _first(event, "DURATION")[1] is not None:
+            duration = parse_duration(_first(event, "DURATION")[1])
+        else:
+            duration = timedelta(days=1) if all_day else timedelta(0)
+        if duration <= timedelta(0):
+            continue
+
+        if "RRULE" in event or "RDATE" in event:
+            recurring.append((event, uid, start, tz, duration))
+            continue
+
+        if start >= local_end or start + duration <= local_start:
+            continue
+        start_epoch = to_epoch(start, tz)
+        end_epoch = to_epoch(start + duration, tz)
+        if start_epoch < epoch_end and end_epoch > epoch_start:
+            yield start_epoch, end_epoch
+
+    for event, uid, start, tz, duration in recurring:
+        excluded = set(_date_list_epochs(event, "EXDATE", tz))
+        occurrences = []
+        if "RRULE" in event:
+            rule = _localize_until(_first(event, "RRULE")[1], tz)
+            try:
+                expansion_start = skip_to_window(rule, start, local_start - duration)
+                occurrences = parse_rrule(rule).replace(dtstart=expansion_start).between(
+                    local_start - duration, local_end, inc=True
+                )
+            except (ValueError, TypeError) as e:
+                print(f"Skipping event {uid} with unsupported RRULE {rule}: {e}")
+                continue
+
+        candidates = [(to_epoch(occurrence, tz), occurrence) for occurrence in occurrences]
+        for rdate in _date_list_epochs(event, "RDATE", tz):
+            candidates.append((rdate, None))
+        if "RRULE" not in event:
+            candidates.append((to_epoch(start, tz), start))
+
+        for start_epoch, occurrence in candidates:
+            if start_epoch in excluded or (uid, start_epoch) in overridden:
+                continue
+            if occurrence is None:
+                end_epoch = start_epoch + int(duration.total_seconds())
+            else:
+                # Recurring durations are wall-clock, so a 10:00-11:00 series stays 10-11 across DST
+                end_epoch = to_epoch(occurrence + duration, tz)
+            if start_epoch < epoch_end and end_epoch > epoch_start:
+                yield start_epoch, end_epoch
+
+
+def read_busy_intervals(source, start_date, end_date, default_timezone="UTC"):
+    """Read an .ics file path (or iterable of lines) into merged, sorted (starts, ends) epoch arrays."""
+    if isinstance(source, (str, os.PathLike)):
+        stat = os.stat(source)
+        return _read_busy_intervals_file(
+            os.fspath(source), stat.st_mtime_ns, stat.st_size, start_date, end_date, default_timezone
+        )
+    return merge_epoch_intervals(iter_busy_intervals(source, start_date, end_date, default_timezone))
+
+
+@lru_cache(maxsize=64)
+def _read_busy_intervals_file(path, mtime_ns, size, start_date, end_date, default_timezone):
+    # mtime and size are part of the cache key so an edited export is read again
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return merge_epoch_intervals(iter_busy_intervals(f, start_date, end_date, default_timezone))
+
+
+def merge_epoch_intervals(intervals):
+    """Merge (start, end) pairs into sorted, disjoint, read-only (starts, ends) int64 arrays."""
+    pairs = np.fromiter(
+        (value for interval in intervals for value in interval), dtype=np.int64
+    ).reshape(-1, 2)
+    if not len(pairs):
+        empty = np.zeros(0, dtype=np.int64)
+        empty.setflags(write=False)
+        return empty, empty
+
+    pairs = pairs[np.argsort(pairs[:, 0], kind="stable")]
+    starts, ends = pairs[:, 0], np.maximum.accumulate(pairs[:, 1])
+    # A new merged run starts wherever an interval begins after everything before it ended
+    new_run = np.ones(len(starts), dtype=bool)
+    new_run[1:] = starts[1:] > ends[:-1]
+    run_ends = np.append(np.flatnonzero(new_run)[1:] - 1, len(starts) - 1)
+    merged_starts, merged_ends = starts[new_run], ends[run_ends]
+    merged_starts.setflags(write=False)
+    merged_ends.setflags(write=False)
+    return merged_starts, merged_ends
+
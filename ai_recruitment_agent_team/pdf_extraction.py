@@ -0,0 +1,201 @@
+import io
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import PyPDF2
+
+# Worker processes, pages handed to one worker at a time, and limits that keep a
+# pathological PDF from stalling a worker
+PDF_EXTRACTION_WORKERS = int(os.environ.get("PDF_EXTRACTION_WORKERS", os.cpu_count() or 1))
+PDF_EXTRACTION_PAGES_PER_TASK = int(os.environ.get("PDF_EXTRACTION_PAGES_PER_TASK", 4))
+PDF_EXTRACTION_MAX_PAGES = int(os.environ.get("PDF_EXTRACTION_MAX_PAGES", 50))
+PDF_EXTRACTION_TIMEOUT_SECONDS = float(os.environ.get("PDF_EXTRACTION_TIMEOUT", 30))
+
+PdfSource = Union[bytes, bytearray, memoryview, str, os.PathLike, io.IOBase]
+
+
+class ExtractionTimeout(BaseException):
+    # A BaseException, like KeyboardInterrupt, so PyPDF2's broad "except Exception" recovery paths cannot swallow it
+    pass
+
+
+def read_pdf_bytes(source: PdfSource) -> bytes:
+    """Return the raw bytes of a path, bytes-like object or (uploaded) file object."""
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    data = source.read()
+    if source.seekable():
+        source.seek(0)
+    return data
+
+
+@contextmanager
+def _time_limit(seconds: Optional[float]):
+    # SIGALRM interrupts PyPDF2's pure-Python parsing; without it the caller's timeout still applies
+    if not seconds or not hasattr(signal, "SIGALRM") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def on_timeout(signum, frame):
+        raise ExtractionTimeout(f"PDF extraction exceeded {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, on_timeout)
+    # Keep firing after the first alarm in case a bare "except:" inside PyPDF2 swallowed it
+    signal.setitimer(signal.ITIMER_REAL, seconds, 0.05)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    remaining = None if deadline is None else deadline - time.time()
+    if remaining is not None and remaining <= 0:
+        # The document's deadline passed while this task waited in the queue
+        raise ExtractionTimeout("PDF extraction deadline passed before the pages were started")
+    return remaining
+
+
+def extract_pages(data: bytes, start: int, stop: int, deadline: Optional[float] = None) -> List[str]:
+    """Extract the text of pages [start, stop) of a PDF by a time.time() deadline; runs inside pool workers."""
+    with _time_limit(_remaining(deadline)):
+        reader = PyPDF2.PdfReader(io.BytesIO(data))
+        return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+def count_and_extract_pages(data: bytes, stop: int, deadline: Optional[float] = None) -> Tuple[int, List[str]]:
+    """Return a PDF's page count and the text of its pages [0, stop); the first task of every document.
+
+    Parsing the document to count its pages can itself stall on a pathological file,
+    so it happens here, under the deadline, rather than in the caller.
+    """
+    with _time_limit(_remaining(deadline)):
+        reader = PyPDF2.PdfReader(io.BytesIO(data))
+        total_pages = len(reader.pages)
+        return total_pages, [reader.pages[index].extract_text() or "" for index in range(min(stop, total_pages))]
+
+
+class PdfExtractionService:
+    """Extract PDF text on a process pool, fanning documents and page ranges out to workers.
+
+    Each document is split into page ranges of pages_per_task that are extracted in
+    parallel and joined in order. Documents are capped at max_pages and must finish
+    within timeout seconds of being submitted, or the document is reported as failed.
+    """
+
+    def __init__(self, max_workers: int = PDF_EXTRACTION_WORKERS,
+                 pages_per_task: int = PDF_EXTRACTION_PAGES_PER_TASK,
+                 max_pages: int = PDF_EXTRACTION_MAX_PAGES,
+                 timeout: float = PDF_EXTRACTION_TIMEOUT_SECONDS):
+        self.max_workers = max_workers
+        self.pages_per_task = pages_per_task
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking a threaded server (e.g. Streamlit) is unsafe, so workers are spawned fresh
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _submit(self, source: PdfSource):
+        """Submit the document's first page range, which also counts its pages; returns _collect's arguments."""
+        started_at = time.perf_counter()
+        # Wall-clock so that worker processes can check the same deadline
+        deadline = time.time() + self.timeout
+        result = {"text": "", "pages": 0, "total_pages": 0, "truncated": False, "seconds": 0.0, "error": None}
+        data, futures = b"", []
+        try:
+            data = read_pdf_bytes(source)
+            futures.append(self.executor.submit(
+                count_and_extract_pages, data, min(self.pages_per_task, self.max_pages), deadline
+            ))
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        return started_at, deadline, result, data, futures
+
+    def _collect(self, started_at: float, deadline: float, result: Dict, data: bytes, futures: List) -> Dict:
+        """Wait for the first range, fan the remaining ranges out to the pool and join the text in order."""
+        try:
+            if futures:
+                # Workers stop themselves at the deadline; this also covers a worker stuck outside Python code
+                result["total_pages"], parts = futures[0].result(timeout=max(deadline - time.time(), 0))
+                result["pages"] = min(result["total_pages"], self.max_pages)
+                result["truncated"] = result["total_pages"] > self.max_pages
+                futures.extend(
+                    self.executor.submit(
+                        extract_pages, data, start, min(start + self.pages_per_task, result["pages"]), deadline
+                    )
+                    for start in range(len(parts), result["pages"], self.pages_per_task)
+                )
+                for future in futures[1:]:
+                    parts.extend(future.result(timeout=max(deadline - time.time(), 0)))
+                result["text"] = "".join(parts)
+        except (FutureTimeoutError, ExtractionTimeout):
+            result["error"] = f"ExtractionTimeout: PDF extraction exceeded {self.timeout}s"
+        except BrokenProcessPool as e:
+            # A worker died (e.g. out of memory); start a fresh pool for the next document
+            result["error"] = f"BrokenProcessPool: {e}"
+            self.shutdown()
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            for future in futures:
+                future.cancel()
+        result["seconds"] = round(time.perf_counter() - started_at, 4)
+        return result
+
+    def extract(self, source: PdfSource) -> Dict:
+        """Extract one document: {text, pages, total_pages, truncated, seconds, error}."""
+        return self._collect(*self._submit(source))
+
+    def extract_many(self, sources: Iterable[PdfSource]) -> Iterator[Dict]:
+        """Extract documents in input order, keeping up to max_workers documents in flight."""
+        pending = []
+        for source in sources:
+            pending.append(self._submit(source))
+            if len(pending) > self.max_workers:
+                yield self._collect(*pending.pop(0))
+        for submitted in pending:
+            yield self._collect(*submitted)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_extraction_service() -> PdfExtractionService:
+    """Return the process-wide extraction service, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = PdfExtractionService()
+        return _service
+
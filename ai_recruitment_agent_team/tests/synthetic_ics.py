@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+
+def synthetic_calendar(events, start):
+    """Lines of an Outlook-style export: mostly one-off meetings plus some weekly series."""
+    zones = ["America/New_York", "Europe/London", "W. Europe Standard Time", "India Standard Time", None]
+    yield "BEGIN:VCALENDAR"
+    for index in range(events):
+        day = start + timedelta(days=index % 365, hours=8 + index % 9)
+        zone = zones[index % len(zones)]
+        prefix = f";TZID={zone}" if zone else ""
+        suffix = "" if zone else "Z"
+        yield "BEGIN:VEVENT"
+        yield f"UID:event-{index}"
+        yield f"DTSTART{prefix}:{day:%Y%m%dT%H%M%S}{suffix}"
+        yield f"DTEND{prefix}:{day + timedelta(minutes=30 + 15 * (index % 4)):%Y%m%dT%H%M%S}{suffix}"
+        if index % 10 == 0:
+            yield "RRULE:FREQ=WEEKLY;INTERVAL=1"
+            yield f"EXDATE{prefix}:{day + timedelta(weeks=3):%Y%m%dT%H%M%S}{suffix}"
+        yield "SUMMARY:Synthetic meeting with a description long enough to look like a real export"
+        yield "END:VEVENT"
+    yield "END:VCALENDAR"
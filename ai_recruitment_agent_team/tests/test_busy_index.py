@@ -0,0 +1,40 @@
+import pytest
+
+from time_slots import BusyIndex, parse_teams_calendar
+
+NINE_TO_FIVE = {0: [(9 * 60, 17 * 60)]}
+
+
+def meeting(day, start, end):
+    return {"day": day, "start": start, "end": end}
+
+
+def test_nested_meeting_does_not_reopen_the_outer_one():
+    # The 11:00-11:30 meeting sits inside 10:00-12:00; 11:30-12:00 must stay busy
+    calendar = [meeting(0, (10, 0), (12, 0)), meeting(0, (11, 0), (11, 30))]
+    monday = [slot for slot in parse_teams_calendar(calendar) if slot[0] == 0]
+    assert monday == [(0, (9, 0), (10, 0)), (0, (12, 0), (17, 0))]
+
+
+@pytest.mark.parametrize("calendar, expected", [
+    # Partial overlap, listed out of order
+    ([meeting(0, (11, 0), (12, 30)), meeting(0, (10, 0), (11, 30))],
+     [(0, (9, 0), (10, 0)), (0, (12, 30), (17, 0))]),
+    # Back-to-back meetings leave no zero-length gap between them
+    ([meeting(0, (10, 0), (11, 0)), meeting(0, (11, 0), (12, 0))],
+     [(0, (9, 0), (10, 0)), (0, (12, 0), (17, 0))]),
+    # Meetings spilling over the working hours only clip them
+    ([meeting(0, (8, 0), (9, 30)), meeting(0, (16, 0), (18, 0))],
+     [(0, (9, 30), (16, 0))]),
+])
+def test_overlapping_meetings_leave_only_true_gaps(calendar, expected):
+    assert parse_teams_calendar(calendar, working_hours=NINE_TO_FIVE) == expected
+
+
+def test_busy_index_merges_and_answers_queries():
+    index = BusyIndex([(600, 720), (660, 690), (800, 810), (810, 820)])
+    assert (index.starts, index.ends) == ([600, 800], [720, 820])
+    assert not index.is_free(700, 710)
+    assert index.is_free(720, 800)
+    assert index.busy_within(650, 805) == [(650, 720), (800, 805)]
+    assert index.free_gaps(540, 1020) == [(540, 600), (720, 800), (820, 1020)]
@@ -0,0 +1,87 @@
+import pytest
+import requests
+
+import time_slots
+from time_slots import CircuitBreaker, CircuitOpenError, ClaudeClient
+
+
+class Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+
+
+class ScriptedSession:
+    """Returns the scripted responses in order (repeating the last); exceptions are raised."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(time_slots, "LLM_BACKOFF_BASE_SECONDS", 0)
+    monkeypatch.setattr(time_slots, "get_api_key", lambda: "test-key")
+    client = ClaudeClient(rate_limit=1e9, burst=1e9, max_retries=4, circuit_breaker=CircuitBreaker(failure_threshold=5))
+    return client
+
+
+def post(client, *outcomes):
+    client._session = ScriptedSession(*outcomes)
+    return client.post_messages({})
+
+
+def test_rate_limited_calls_never_open_the_breaker(client):
+    for _ in range(10):
+        assert post(client, Response(429, {"retry-after": "0"})).status_code == 429
+        assert client._session.calls == 5
+    assert not client.circuit_breaker.is_open
+    assert client.stats()["failures"] == 10
+
+
+def test_request_timeout_status_is_treated_as_rate_limiting(client):
+    for _ in range(5):
+        post(client, Response(408))
+    assert not client.circuit_breaker.is_open
+
+
+def test_server_errors_count_once_per_call(client):
+    for _ in range(4):
+        post(client, Response(503))
+    assert client.circuit_breaker.failures == 4
+    assert not client.circuit_breaker.is_open
+    post(client, Response(529))
+    assert client.circuit_breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        post(client, Response(200))
+
+
+def test_connection_errors_count_once_per_call(client):
+    with pytest.raises(requests.ConnectionError):
+        post(client, requests.ConnectionError())
+    assert client._session.calls == 5
+    assert client.circuit_breaker.failures == 1
+
+
+def test_retried_call_that_succeeds_resets_the_breaker(client):
+    post(client, Response(503))
+    post(client, Response(503))
+    assert post(client, Response(503), Response(429), Response(200)).status_code == 200
+    assert client.circuit_breaker.failures == 0
+
+
+def test_half_open_probe_can_retry(client):
+    client.circuit_breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=0)
+    post(client, Response(503))
+    assert client.circuit_breaker.is_open
+    assert post(client, Response(429), Response(200)).status_code == 200
+    assert not client.circuit_breaker.is_open
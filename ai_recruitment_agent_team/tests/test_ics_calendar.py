@@ -0,0 +1,145 @@
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytz
+
+from ics_calendar import iter_busy_intervals, merge_epoch_intervals, read_busy_intervals
+from synthetic_ics import synthetic_calendar
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+MARCH_START = date(2025, 3, 1)
+MARCH_END = date(2025, 3, 31)
+
+
+def fixture_path(name):
+    return os.path.join(FIXTURES, name)
+
+
+def busy(name, start=MARCH_START, end=MARCH_END, default_timezone="UTC"):
+    with open(fixture_path(name)) as f:
+        return sorted(iter_busy_intervals(f, start, end, default_timezone))
+
+
+def epoch(zone, *fields):
+    return int(pytz.timezone(zone).localize(datetime(*fields)).timestamp())
+
+
+def span(zone, start_fields, minutes):
+    start = epoch(zone, *start_fields)
+    return start, start + minutes * 60
+
+
+def test_weekly_series_honours_exdate_rdate_and_overrides():
+    intervals = busy("recurring.ics")
+    weekly = [interval for interval in intervals if interval[1] - interval[0] == 3600]
+    assert weekly == [
+        span("America/New_York", (2025, 3, 3, 10), 60),
+        # RDATE adds a one-off Wednesday occurrence
+        span("America/New_York", (2025, 3, 5, 15), 60),
+        # RECURRENCE-ID moves the 10th to 13:00 and suppresses the original
+        span("America/New_York", (2025, 3, 10, 13), 60),
+        # The 17th is excluded by EXDATE; the 24th is the last before UNTIL
+        span("America/New_York", (2025, 3, 24, 10), 60),
+    ]
+
+
+def test_weekly_series_keeps_wall_clock_time_across_dst():
+    intervals = busy("recurring.ics")
+    before_dst = span("America/New_York", (2025, 3, 3, 10), 60)
+    after_dst = span("America/New_York", (2025, 3, 24, 10), 60)
+    assert before_dst in intervals and after_dst in intervals
+    # 10:00 EST is 15:00 UTC, 10:00 EDT is 14:00 UTC
+    assert datetime.utcfromtimestamp(before_dst[0]).hour == 15
+    assert datetime.utcfromtimestamp(after_dst[0]).hour == 14
+
+
+def test_utc_until_is_compared_in_the_series_timezone():
+    # UNTIL=20250322T010000Z is 10:00 on the 22nd in Tokyo, so the 22nd is included
+    intervals = busy("recurring.ics")
+    tokyo = [interval for interval in intervals if interval[1] - interval[0] == 1800]
+    assert tokyo == [span("Asia/Tokyo", (2025, 3, day, 10), 30) for day in (20, 21, 22)]
+
+
+def test_long_running_series_is_expanded_only_inside_the_window():
+    intervals = busy("long_running.ics")
+    first = datetime(2020, 1, 6, 6)
+    # The window is widened by a day before start and two days after end
+    expected = []
+    day = datetime(2025, 2, 28, 6)
+    while day < datetime(2025, 4, 2):
+        if (day - first).days % 2 == 0:
+            expected.append(span("UTC", (day.year, day.month, day.day, 6), 15))
+        day += timedelta(days=1)
+    assert intervals == expected
+
+
+def test_windows_timezone_names_and_folded_lines():
+    intervals = busy("outlook.ics")
+    # "W. Europe Standard Time" is Berlin; the DTSTART line is folded mid-TZID
+    assert span("Europe/Berlin", (2025, 3, 4, 9), 60) in intervals
+
+
+def test_all_day_and_floating_events_use_the_default_timezone():
+    intervals = busy("outlook.ics", default_timezone="America/Chicago")
+    assert span("America/Chicago", (2025, 3, 6, 0), 24 * 60) in intervals
+    assert span("America/Chicago", (2025, 3, 7, 9), 60) in intervals
+
+
+def test_free_cancelled_and_out_of_window_events_are_skipped():
+    intervals = busy("outlook.ics")
+    starts = {datetime.utcfromtimestamp(start) for start, _ in intervals}
+    assert datetime(2025, 3, 5, 14) not in starts  # TRANSP:TRANSPARENT
+    assert datetime(2025, 3, 5, 16) not in starts  # STATUS:CANCELLED
+    assert all(start.year == 2025 for start in starts)
+
+
+def test_crlf_exports_parse_like_lf():
+    with open(fixture_path("outlook.ics")) as f:
+        lines = f.read().splitlines()
+    crlf = [line + "\r\n" for line in lines]
+    assert sorted(iter_busy_intervals(crlf, MARCH_START, MARCH_END)) == busy("outlook.ics")
+
+
+def test_read_busy_intervals_merges_overlaps():
+    starts, ends = read_busy_intervals(fixture_path("outlook.ics"), MARCH_START, MARCH_END)
+    # utc-call (12:00-12:45) and overlap-a (12:00-13:00) merge into one interval
+    noon = epoch("UTC", 2025, 3, 5, 12)
+    assert (noon, noon + 3600) in list(zip(starts.tolist(), ends.tolist()))
+    assert all(end < start for end, start in zip(ends[:-1], starts[1:]))
+
+
+def test_read_busy_intervals_rereads_an_edited_file(tmp_path):
+    path = tmp_path / "calendar.ics"
+    with open(fixture_path("outlook.ics")) as f:
+        original = f.read()
+    path.write_text(original)
+    first = read_busy_intervals(str(path), MARCH_START, MARCH_END)
+
+    path.write_text(original.replace("UID:utc-call\nDTSTART:20250305T120000Z", "UID:utc-call\nDTSTART:20250305T180000Z"))
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000_000))
+    second = read_busy_intervals(str(path), MARCH_START, MARCH_END)
+    assert len(second[0]) == len(first[0]) + 1
+
+
+@pytest.mark.parametrize("pairs, expected", [
+    ([], ([], [])),
+    ([(5, 10), (1, 3), (2, 4)], ([1, 5], [4, 10])),
+    ([(1, 10), (2, 3), (4, 12)], ([1], [12])),
+    ([(1, 2), (2, 3)], ([1], [3])),
+])
+def test_merge_epoch_intervals(pairs, expected):
+    starts, ends = merge_epoch_intervals(pairs)
+    assert (starts.tolist(), ends.tolist()) == expected
+    assert not starts.flags.writeable
+
+
+def test_ten_thousand_event_export_reads_quickly(tmp_path):
+    path = tmp_path / "large.ics"
+    path.write_text("\r\n".join(synthetic_calendar(10000, datetime(2024, 1, 1))) + "\r\n")
+    started_at = time.perf_counter()
+    starts, _ = read_busy_intervals(str(path), date(2024, 9, 2), date(2024, 9, 30))
+    # About 0.4s on a single core; the bound only catches a return to replaying full recurrence history
+    assert time.perf_counter() - started_at < 5
+    assert len(starts) > 0
@@ -0,0 +1,65 @@
+import io
+import os
+
+import PyPDF2
+import pytest
+
+import pdf_extraction
+from pdf_extraction import PdfExtractionService, read_pdf_bytes
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESUME = os.path.join(APP_DIR, "Pradeep_Data_Engineer_6+.pdf")
+
+
+@pytest.fixture(scope="module")
+def service():
+    service = PdfExtractionService(max_workers=1, pages_per_task=1)
+    yield service
+    service.shutdown()
+
+
+def reference_text(path):
+    return "".join(page.extract_text() for page in PyPDF2.PdfReader(path).pages)
+
+
+def test_extracts_text_in_page_order(service):
+    result = service.extract(RESUME)
+    assert result["error"] is None
+    assert result["total_pages"] == result["pages"] == len(PyPDF2.PdfReader(RESUME).pages)
+    assert result["text"] == reference_text(RESUME)
+
+
+def test_caller_never_parses_the_pdf(service, monkeypatch):
+    # Page counting runs in the worker under the deadline; the workers import their own PyPDF2
+    def refuse(*args, **kwargs):
+        raise AssertionError("the PDF was parsed in the calling process")
+
+    monkeypatch.setattr(pdf_extraction.PyPDF2, "PdfReader", refuse)
+    result = service.extract(read_pdf_bytes(RESUME))
+    assert result["error"] is None
+    assert result["text"]
+
+
+def test_truncates_to_max_pages():
+    service = PdfExtractionService(max_workers=1, pages_per_task=4, max_pages=1)
+    try:
+        result = service.extract(RESUME)
+    finally:
+        service.shutdown()
+    first_page = PyPDF2.PdfReader(RESUME).pages[0].extract_text()
+    assert (result["pages"], result["text"]) == (1, first_page)
+    assert result["truncated"] == (result["total_pages"] > 1)
+
+
+def test_invalid_pdf_is_reported_not_raised(service):
+    result = service.extract(io.BytesIO(b"not a pdf"))
+    assert result["error"] and result["text"] == ""
+
+
+def test_deadline_covers_page_counting():
+    service = PdfExtractionService(max_workers=1, timeout=1e-6)
+    try:
+        result = service.extract(RESUME)
+    finally:
+        service.shutdown()
+    assert result["error"].startswith("ExtractionTimeout")
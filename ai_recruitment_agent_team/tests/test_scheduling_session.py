@@ -0,0 +1,59 @@
+import json
+import os
+
+import pytest
+
+import time_slots
+from time_slots import SchedulingSession, find_best_meeting_times
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch, tmp_path):
+    # No key: preference analysis is skipped, and the texts below are read by the local grammar
+    monkeypatch.setattr(time_slots, "get_api_key", lambda: None)
+    config_path = tmp_path / "scoring.json"
+    config_path.write_text(json.dumps({"buffer": {"score": -5}, "attendee_comfort": {"score": -2}}))
+    monkeypatch.setattr(time_slots, "SCORING_CONFIG_PATH", str(config_path))
+    return config_path
+
+
+def panel(*attendees):
+    return {
+        "attendees": list(attendees),
+        "date_range": {"start": "2026-03-02", "end": "2026-03-13"},
+        "target_timezone": "America/New_York",
+    }
+
+
+ALICE = {"name": "Alice", "availability_text": "weekdays 9am-5pm", "timezone": "America/New_York",
+         "teams_calendar": [{"day": 0, "start": (10, 0), "end": (11, 0)}]}
+BOB = {"name": "Bob", "availability_text": "weekdays 9am-5pm", "timezone": "Europe/London"}
+
+
+def test_matches_full_run_after_update():
+    session = SchedulingSession(panel(ALICE, BOB))
+    assert session.best_meeting_times() == find_best_meeting_times(panel(ALICE, BOB))
+
+    moved = dict(ALICE, teams_calendar=[{"day": 2, "start": (9, 0), "end": (10, 30)}])
+    changed_days = session.update_attendee(moved)
+    assert 0 < len(changed_days) < len(session.date_range)
+    assert session.best_meeting_times() == find_best_meeting_times(panel(moved, BOB))
+
+
+def test_rescores_every_day_after_config_reload(offline):
+    session = SchedulingSession(panel(ALICE, BOB))
+    offline.write_text(json.dumps({"recency": {"score_per_day": 50}}))
+    stamp = os.stat(offline).st_mtime_ns + 10 ** 9
+    os.utime(offline, ns=(stamp, stamp))
+
+    expected = find_best_meeting_times(panel(ALICE, BOB))
+    assert expected["best_meeting_times"][0]["date"] == "2026-03-13"
+    assert session.best_meeting_times() == expected
+
+
+def test_nameless_attendee_is_added_not_matched():
+    nameless = {"availability_text": "weekdays 9am-5pm", "timezone": "America/New_York"}
+    session = SchedulingSession(panel(ALICE, nameless))
+    other = {"availability_text": "weekdays 1pm-5pm", "timezone": "America/New_York"}
+    session.update_attendee(other)
+    assert session.attendees == [ALICE, nameless, other]
@@ -3,11 +3,20 @@ import re
 from datetime import datetime, timedelta, timezone
 import pytz
 from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import random
+import threading
+import time
+import numpy as np
 
-with open('api_key.txt') as f:
-    api_key = f.read().strip()
+from disk_cache import DiskCache, make_cache_key
+from ics_calendar import read_busy_intervals
 
 # Map of common timezone names/abbreviations to IANA timezone names
 TIMEZONE_MAPPING = {
@@ -48,8 +57,317 @@ TIMEZONE_MAPPING = {
     "Asia/Dubai": "Asia/Dubai",
 }
 
+# Claude model used for all parsing/analysis calls
+CLAUDE_MODEL = "claude-3-7-sonnet-20250219"
+
+# Bump whenever the availability parsing prompt changes so stale cache entries are ignored
+AVAILABILITY_PROMPT_VERSION = 1
+
+CLAUDE_API_URL = "https://api.anthropic.com/v1/messages"
+
+# Upper bound on simultaneous Claude requests, and per-request timeout in seconds. The default
+# lets a 20-attendee run (one parse per attendee plus the preference analysis) go out in one wave
+LLM_MAX_CONCURRENCY = int(os.environ.get("TIME_SLOTS_LLM_CONCURRENCY", 24))
+LLM_TIMEOUT_SECONDS = float(os.environ.get("TIME_SLOTS_LLM_TIMEOUT", 30))
+
+# Client-side rate limit (requests per second, burst size) and retry policy for Claude calls.
+# The burst covers a full concurrent fan-out so one scheduling run is not throttled;
+# the rate only paces sustained load across runs
+LLM_RATE_LIMIT_PER_SECOND = float(os.environ.get("TIME_SLOTS_LLM_RATE_LIMIT", 5))
+LLM_RATE_LIMIT_BURST = int(os.environ.get("TIME_SLOTS_LLM_RATE_BURST", max(LLM_MAX_CONCURRENCY, 20)))
+LLM_MAX_RETRIES = int(os.environ.get("TIME_SLOTS_LLM_MAX_RETRIES", 4))
+LLM_BACKOFF_BASE_SECONDS = 0.5
+LLM_BACKOFF_MAX_SECONDS = 30.0
+
+# Status codes worth retrying: rate limited, overloaded and transient server errors
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504, 529}
+
+# Throttling rather than an outage: backed off on, but never counted toward the circuit breaker
+RATE_LIMITED_STATUS_CODES = {408, 429}
+
+# Where the Anthropic API key is looked up, in order, on first use
+API_KEY_ENV_VAR = "ANTHROPIC_API_KEY"
+API_KEY_FILE = os.environ.get("TIME_SLOTS_API_KEY_FILE", "api_key.txt")
+
+# Upper bounds (seconds) of the latency histogram buckets reported by ClaudeClient.stats()
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, float("inf"))
+
+# On-disk cache of parsed availability, shared by every process on the host
+availability_cache = DiskCache(
+    os.environ.get("TIME_SLOTS_CACHE_PATH", os.path.join(".cache", "time_slots.db")),
+    ttl_seconds=int(os.environ.get("TIME_SLOTS_CACHE_TTL", 30 * 24 * 3600)),
+    max_entries=int(os.environ.get("TIME_SLOTS_CACHE_MAX_ENTRIES", 10000)),
+)
+
+# Local parses at or above this confidence are used without calling Claude
+LOCAL_PARSER_MIN_CONFIDENCE = 0.8
+
+# Panels at least this large are intersected with the NumPy minute-grid backend
+BITMAP_BACKEND_MIN_ATTENDEES = 25
+
+MINUTES_PER_DAY = 24 * 60
+
+# Resolution of the timezone offset tables. UTC offsets are whole quarter hours and
+# DST switches happen on them, so one offset per source-local quarter hour is exact
+# even when the target switches in the middle of a source hour (e.g. Kolkata -> Sydney).
+OFFSET_STEP_MINUTES = 15
+OFFSET_STEPS_PER_DAY = MINUTES_PER_DAY // OFFSET_STEP_MINUTES
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the upstream while the circuit breaker is open."""
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets a single trial call through after the cooldown."""
+    
+    def __init__(self, failure_threshold=5, cooldown_seconds=30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+    
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+                # Half-open: push the window forward so only this caller probes the upstream
+                self.opened_at = time.monotonic()
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+    
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+def parse_retry_after(response):
+    """Return the retry-after header of a response in seconds, or None."""
+    value = response.headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+def env_credential(name=API_KEY_ENV_VAR):
+    """Credential source reading an environment variable."""
+    return lambda: os.environ.get(name)
+
+def file_credential(path=API_KEY_FILE):
+    """Credential source reading the first line of a file, if it exists."""
+    def read():
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return None
+    return read
+
+class CredentialProvider:
+    """Resolve a credential lazily from a list of sources and cache the first non-empty one.
+    
+    A source is any callable returning the credential or None. Nothing is read until
+    get() is first called, so importing this module has no file or environment side effects.
+    """
+    
+    def __init__(self, sources):
+        self.sources = list(sources)
+        self._value = None
+        self._lock = threading.Lock()
+    
+    def get(self):
+        """Return the cached credential, resolving it on first use; None if no source has one."""
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = next(filter(None, (source() for source in self.sources)), None)
+        return self._value
+    
+    def reset(self):
+        """Forget the cached credential so the next get() reads the sources again (e.g. after rotation)."""
+        with self._lock:
+            self._value = None
+
+credential_provider = CredentialProvider([env_credential(), file_credential()])
+
+def set_credential_provider(provider):
+    """Replace the module's credential source with a CredentialProvider or a plain callable."""
+    global credential_provider
+    credential_provider = provider if isinstance(provider, CredentialProvider) else CredentialProvider([provider])
+
+def get_api_key():
+    """Return the Anthropic API key, resolved on first use and cached."""
+    return credential_provider.get()
+
+class ClaudeClient:
+    """Messages API client shared by every Claude call in this module.
+    
+    Requests go through a pooled HTTP session with a per-request timeout, a
+    client-side token bucket, jittered exponential backoff that honors
+    retry-after, and a circuit breaker that fails fast while the upstream is down.
+    """
+    
+    def __init__(self, max_concurrency=LLM_MAX_CONCURRENCY, timeout=LLM_TIMEOUT_SECONDS,
+                 rate_limit=LLM_RATE_LIMIT_PER_SECOND, burst=LLM_RATE_LIMIT_BURST,
+                 max_retries=LLM_MAX_RETRIES, circuit_breaker=None):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.rate_limiter = TokenBucket(rate_limit, burst)
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._session = None
+        self._executor = None
+        self._stats_lock = threading.Lock()
+        self.request_count = 0
+        self.retry_count = 0
+        self.failure_count = 0
+        self.latency_histogram = [0] * len(LATENCY_BUCKETS)
+    
+    @property
+    def session(self):
+        if self._session is None:
+            # One keep-alive connection per worker, reused across calls
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency))
+            self._session = session
+        return self._session
+    
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="claude")
+        return self._executor
+    
+    def _record_latency(self, seconds):
+        with self._stats_lock:
+            self.request_count += 1
+            for index, upper_bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= upper_bound:
+                    self.latency_histogram[index] += 1
+                    break
+    
+    def _backoff(self, attempt, retry_after=None):
+        """Sleep with full-jitter exponential backoff, never shorter than retry-after."""
+        delay = random.uniform(0, min(LLM_BACKOFF_MAX_SECONDS, LLM_BACKOFF_BASE_SECONDS * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, LLM_BACKOFF_MAX_SECONDS))
+        with self._stats_lock:
+            self.retry_count += 1
+        time.sleep(delay)
+    
+    def post_messages(self, payload):
+        """POST a Messages API payload and return the final response after retries.
+        
+        Raises CircuitOpenError while the breaker is open, and re-raises the last
+        network error if every attempt failed to get a response. A call that fails
+        after its retries counts as one breaker failure, unless it was only ever
+        rate limited (408/429).
+        """
+        headers = {
+            "x-api-key": get_api_key(),
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json"
+        }
+        
+        # Checked once per call: a half-open probe must be able to retry
+        if not self.circuit_breaker.allow():
+            raise CircuitOpenError("Claude API circuit breaker is open")
+        
+        upstream_failed = False
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            started_at = time.perf_counter()
+            try:
+                response = self.session.post(CLAUDE_API_URL, headers=headers, json=payload, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record_latency(time.perf_counter() - started_at)
+                if attempt == self.max_retries:
+                    with self._stats_lock:
+                        self.failure_count += 1
+                    self.circuit_breaker.record_failure()
+                    raise
+                upstream_failed = True
+                self._backoff(attempt)
+                continue
+            
+            self._record_latency(time.perf_counter() - started_at)
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                self.circuit_breaker.record_success()
+                return response
+            
+            if response.status_code not in RATE_LIMITED_STATUS_CODES:
+                upstream_failed = True
+            if attempt == self.max_retries:
+                break
+            self._backoff(attempt, parse_retry_after(response))
+        
+        with self._stats_lock:
+            self.failure_count += 1
+        if upstream_failed:
+            self.circuit_breaker.record_failure()
+        return response
+    
+    def submit(self, fn, *args, **kwargs):
+        """Run fn on the worker pool and return its future."""
+        return self.executor.submit(fn, *args, **kwargs)
+    
+    def map_unique(self, fn, keys):
+        """Call fn(*key) once per distinct key concurrently and return a {key: result} dict."""
+        unique_keys = list(dict.fromkeys(keys))
+        futures = {key: self.submit(fn, *key) for key in unique_keys}
+        return {key: future.result() for key, future in futures.items()}
+    
+    def stats(self):
+        """Return request, retry and failure counts plus the latency histogram."""
+        with self._stats_lock:
+            return {
+                "requests": self.request_count,
+                "retries": self.retry_count,
+                "failures": self.failure_count,
+                "circuit_open": self.circuit_breaker.is_open,
+                "latency_histogram": {
+                    ("+inf" if upper_bound == float("inf") else f"<={upper_bound}s"): count
+                    for upper_bound, count in zip(LATENCY_BUCKETS, self.latency_histogram)
+                },
+            }
+
+claude_client = ClaudeClient()
+
+@lru_cache(maxsize=256)
 def get_timezone(timezone_str):
-    """Convert timezone string to pytz timezone object."""
+    """Convert timezone string to pytz timezone object (memoized)."""
     if not timezone_str:
         return pytz.UTC  # Default to UTC
     
@@ -66,18 +384,24 @@ def get_timezone(timezone_str):
         print(f"Unknown timezone: {timezone_str}, defaulting to UTC")
         return pytz.UTC
 
+def normalize_availability_text(availability_text):
+    """Normalize availability text so trivially different phrasings share a cache entry."""
+    return " ".join(availability_text.lower().split())
+
 def parse_availability_with_claude(availability_text, attendee_timezone=None):
     """Use Claude API to parse availability text into structured format."""
-    #api_key = os.environ.get("ANTHROPIC_API_KEY")
+    cache_key = make_cache_key(
+        normalize_availability_text(availability_text),
+        attendee_timezone,
+        CLAUDE_MODEL,
+        AVAILABILITY_PROMPT_VERSION,
+    )
+    cached = availability_cache.get(cache_key)
+    if cached is not None:
+        return [(day, tuple(start_time), tuple(end_time)) for day, start_time, end_time in cached]
 
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-    
-    headers = {
-        "x-api-key": api_key,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json"
-    }
+    if not get_api_key():
+        raise ValueError(f"An Anthropic API key is required ({API_KEY_ENV_VAR} or {API_KEY_FILE})")
     
     prompt = f"""
     Parse the following availability text: "{availability_text}"
@@ -98,18 +422,14 @@ def parse_availability_with_claude(availability_text, attendee_timezone=None):
     """
     
     payload = {
-        "model": "claude-3-7-sonnet-20250219",
+        "model": CLAUDE_MODEL,
         "max_tokens": 1000,
         "messages": [
             {"role": "user", "content": prompt}
         ]
     }
     
-    response = requests.post(
-        "https://api.anthropic.com/v1/messages",
-        headers=headers,
-        json=payload
-    )
+    response = claude_client.post_messages(payload)
     
     if response.status_code != 200:
         raise Exception(f"API request failed: {response.text}")
@@ -141,45 +461,68 @@ def parse_availability_with_claude(availability_text, attendee_timezone=None):
             end_time = (parsed_data["end_time"]["hour"], parsed_data["end_time"]["minute"])
             availability.append((day_code, start_time, end_time))
     
+    availability_cache.set(cache_key, availability)
     return availability
 
+# Day tokens recognised by parse_availability_fallback, in the order days are reported
+FALLBACK_DAY_TOKENS = {
+    'monday': 0, 'mon': 0, 
+    'tuesday': 1, 'tue': 1, 'tues': 1,
+    'wednesday': 2, 'wed': 2, 'weds': 2,
+    'thursday': 3, 'thu': 3, 'thurs': 3,
+    'friday': 4, 'fri': 4,
+    'saturday': 5, 'sat': 5,
+    'sunday': 6, 'sun': 6
+}
+
+# A token matches itself or its plural, so map every such word to a bitmask of the tokens it
+# satisfies, one bit per token in FALLBACK_DAY_TOKENS order ("tues" is both "tue" + s and "tues")
+_FALLBACK_WORD_MASKS = defaultdict(int)
+for _bit, _token in enumerate(FALLBACK_DAY_TOKENS):
+    _FALLBACK_WORD_MASKS[_token] |= 1 << _bit
+    _FALLBACK_WORD_MASKS[_token + 's'] |= 1 << _bit
+_FALLBACK_WORD_MASKS = dict(_FALLBACK_WORD_MASKS)
+
+# Day tokens only match whole \w+ runs (\bword\b), and every token starts with one of these
+# prefixes, so scanning for words with those prefixes plus a set lookup finds them all
+FALLBACK_DAY_WORD_PATTERN = re.compile(r'\b(?:mon|tue|wed|thu|fri|sat|sun)\w*')
+FALLBACK_WORKING_DAYS_PATTERN = re.compile(r'(every|all)\s+working\s+day')
+FALLBACK_TIME_PATTERN = re.compile(r'(\d+)(?::(\d+))?\s*([ap]m)\s*to\s*(\d+)(?::(\d+))?\s*([ap]m)')
+
+@lru_cache(maxsize=1024)
+def _fallback_days(token_mask):
+    """Return day codes for a bitmask of matched tokens, in FALLBACK_DAY_TOKENS order."""
+    return tuple(code for bit, code in enumerate(FALLBACK_DAY_TOKENS.values()) if token_mask >> bit & 1)
+
 def parse_availability_fallback(availability_text):
     """Parse availability text to determine available time slots (fallback method)."""
+    return list(_parse_availability_fallback_cached(availability_text))
+
+@lru_cache(maxsize=4096)
+def _parse_availability_fallback_cached(availability_text):
     availability = []
-    
-    # Common patterns
-    days_of_week = {
-        'monday': 0, 'mon': 0, 
-        'tuesday': 1, 'tue': 1, 'tues': 1,
-        'wednesday': 2, 'wed': 2, 'weds': 2,
-        'thursday': 3, 'thu': 3, 'thurs': 3,
-        'friday': 4, 'fri': 4,
-        'saturday': 5, 'sat': 5,
-        'sunday': 6, 'sun': 6
-    }
+    text = availability_text.lower()
     
     # Extract working days pattern
-    working_days_pattern = re.search(r'(every|all)\s+working\s+day', availability_text.lower())
-    if working_days_pattern:
+    if 'working' in text and FALLBACK_WORKING_DAYS_PATTERN.search(text):
         # Working days are Monday-Friday
         days = [0, 1, 2, 3, 4]
     else:
-        # Extract specific days
-        days = []
-        for day, code in days_of_week.items():
-            if re.search(fr'\b{day}s?\b', availability_text.lower()):
-                days.append(code)
+        # Extract specific days in a single pass over the text
+        token_mask = 0
+        for word in FALLBACK_DAY_WORD_PATTERN.findall(text):
+            token_mask |= _FALLBACK_WORD_MASKS.get(word, 0)
+        days = _fallback_days(token_mask)
     
     # Extract time range
-    time_pattern = re.search(r'(\d+)(?::(\d+))?\s*(am|pm)\s*to\s*(\d+)(?::(\d+))?\s*(am|pm)', availability_text.lower())
+    time_pattern = FALLBACK_TIME_PATTERN.search(text) if 'to' in text and 'm' in text else None
     if time_pattern:
-        start_hour = int(time_pattern.group(1))
-        start_minute = int(time_pattern.group(2)) if time_pattern.group(2) else 0
-        start_ampm = time_pattern.group(3)
+        start_hour, start_minute, start_ampm, end_hour, end_minute, end_ampm = time_pattern.groups()
+        start_hour = int(start_hour)
+        start_minute = int(start_minute) if start_minute else 0
         
-        end_hour = int(time_pattern.group(4))
-        end_minute = int(time_pattern.group(5)) if time_pattern.group(5) else 0
-        end_ampm = time_pattern.group(6)
+        end_hour = int(end_hour)
+        end_minute = int(end_minute) if end_minute else 0
         
         # Convert to 24-hour format
         if start_ampm == 'pm' and start_hour < 12:
@@ -199,217 +542,950 @@ def parse_availability_fallback(availability_text):
         for day in days:
             availability.append((day, start_time, end_time))
     
-    return availability
+    # Tuples so cached results cannot be mutated by callers
+    return tuple(availability)
 
-def convert_to_target_timezone(day_of_week, start_time, end_time, source_tz, target_tz):
-    """Convert time from source timezone to target timezone, accounting for day changes."""
-    # Create a datetime object for next occurrence of the day of week
-    now = datetime.now()
-    days_ahead = day_of_week - now.weekday()
-    if days_ahead < 0:  # Target day already happened this week
-        days_ahead += 7
-    
-    # Create source datetime objects
-    source_date = now.date() + timedelta(days=days_ahead)
-    source_start_dt = datetime.combine(source_date, datetime.min.time().replace(
-        hour=start_time[0], minute=start_time[1]
-    ))
-    source_end_dt = datetime.combine(source_date, datetime.min.time().replace(
-        hour=end_time[0], minute=end_time[1]
-    ))
-    
-    # Localize to source timezone
-    source_tz = get_timezone(source_tz)
-    source_start_dt = source_tz.localize(source_start_dt)
-    source_end_dt = source_tz.localize(source_end_dt)
-    
-    # Convert to target timezone
-    target_tz = get_timezone(target_tz)
-    target_start_dt = source_start_dt.astimezone(target_tz)
-    target_end_dt = source_end_dt.astimezone(target_tz)
-    
-    # Extract day, hour, and minute
-    target_day = target_start_dt.weekday()
-    target_start_time = (target_start_dt.hour, target_start_dt.minute)
-    target_end_time = (target_end_dt.hour, target_end_dt.minute)
-    
-    # Handle day change
-    if target_start_dt.date() != target_end_dt.date():
-        # If time spans midnight, return two separate slots
-        return [
-            (target_day, target_start_time, (23, 59)),
-            ((target_day + 1) % 7, (0, 0), target_end_time)
-        ]
+def parse_many(texts):
+    """Parse many availability texts with the fallback parser, parsing each distinct text once."""
+    parsed = {}
+    results = []
+    for text in texts:
+        if text not in parsed:
+            parsed[text] = _parse_availability_fallback_cached(text)
+        results.append(list(parsed[text]))
+    return results
+
+# Day tokens understood by the local availability grammar
+LOCAL_DAY_TOKENS = {
+    'monday': 0, 'mon': 0,
+    'tuesday': 1, 'tues': 1, 'tue': 1,
+    'wednesday': 2, 'weds': 2, 'wed': 2,
+    'thursday': 3, 'thurs': 3, 'thur': 3, 'thu': 3,
+    'friday': 4, 'fri': 4,
+    'saturday': 5, 'sat': 5,
+    'sunday': 6, 'sun': 6
+}
+
+LOCAL_DAY_GROUPS = {
+    'weekday': [0, 1, 2, 3, 4],
+    'working': [0, 1, 2, 3, 4],
+    'work': [0, 1, 2, 3, 4],
+    'business': [0, 1, 2, 3, 4],
+    'weekend': [5, 6],
+    'every': [0, 1, 2, 3, 4, 5, 6],
+    'daily': [0, 1, 2, 3, 4, 5, 6],
+    'all': [0, 1, 2, 3, 4, 5, 6],
+}
+
+# Windows assumed for vague parts of the day, in minutes since midnight
+LOCAL_DAY_PARTS = {
+    'morning': (9 * 60, 12 * 60),
+    'afternoon': (12 * 60, 17 * 60),
+    'evening': (17 * 60, 20 * 60),
+}
+
+_DAY = r'(?:' + '|'.join(sorted(LOCAL_DAY_TOKENS, key=len, reverse=True)) + r')s?'
+_TIME = r'(?:noon|midnight|\d{1,2}(?:[:.]\d{2})?(?:\s*[ap]\.?m\.?)?)'
+
+LOCAL_AVAILABILITY_PATTERN = re.compile(
+    rf'\b(?P<day_from>{_DAY})\s*(?:-|–|to|through|thru|until)\s*(?P<day_to>{_DAY})\b'
+    r'|\b(?P<group>week\s*days?|(?:working|work|business)\s*days?|weekends?|every\s*day|everyday|daily|all\s+week)\b'
+    rf'|\b(?P<day>{_DAY})\b'
+    rf'|\bbetween\s+(?P<between_start>{_TIME})\s*(?:and|to|-|–)\s*(?P<between_end>{_TIME})(?![\w:])'
+    rf'|(?<![\w:])(?P<range_start>{_TIME})\s*(?:-|–|to|until|till|through)\s*(?P<range_end>{_TIME})(?![\w:])'
+    rf'|\b(?P<open_word>after|from|since|before|until|till|by)\s+(?P<open_time>{_TIME})(?![\w:])'
+    r'|\b(?P<part>mornings?|afternoons?|evenings?)\b'
+)
+
+LOCAL_TIME_PATTERN = re.compile(r'(?P<hour>\d{1,2})(?:[:.](?P<minute>\d{2}))?\s*(?:(?P<meridiem>[ap])\.?m\.?)?')
+
+# Words that carry no scheduling meaning and do not count against confidence
+LOCAL_FILLER_WORDS = {
+    'i', 'im', 'am', 'is', 'are', 'be', 'can', 'could', 'do', 'will', 'would', 'available', 'free',
+    'and', 'or', 'also', 'plus', 'both', 'on', 'at', 'in', 'the', 'a', 'an', 'every', 'each',
+    'all', 'any', 'from', 'to', 'between', 'time', 'times', 'generally', 'usually', 'typically',
+    'mostly', 'preferably', 'ideally', 'only', 'my', 'me', 'for', 'meetings', 'meeting', 'of', 's',
+    'hours', 'hrs', 'local', 'please', 'works', 'best', 'ok', 'okay', 'fine', 'day', 'days',
+}
+
+# Words that change meaning in ways the grammar cannot represent
+LOCAL_NEGATION_WORDS = {'except', 'not', 'no', 'unavailable', 'busy', 'excluding', 'off', 'never', 'other', 'but'}
+
+def _local_day_code(token):
+    """Map a day token, possibly plural ("mondays", "tues"), to its day code."""
+    return LOCAL_DAY_TOKENS[token] if token in LOCAL_DAY_TOKENS else LOCAL_DAY_TOKENS[token[:-1]]
+
+def _parse_local_time(text):
+    """Parse one time token into (minutes, meridiem) where meridiem is 'a', 'p' or None."""
+    text = text.strip()
+    if text == 'noon':
+        return 12 * 60, 'p'
+    if text == 'midnight':
+        return 0, 'a'
+    match = LOCAL_TIME_PATTERN.fullmatch(text)
+    hour = int(match.group('hour'))
+    minute = int(match.group('minute') or 0)
+    if hour > 24 or minute > 59:
+        return None, None
+    return hour * 60 + minute, match.group('meridiem')
+
+def _apply_meridiem(minutes, meridiem):
+    hour, minute = divmod(minutes, 60)
+    if meridiem == 'p' and hour < 12:
+        hour += 12
+    elif meridiem == 'a' and hour == 12:
+        hour = 0
+    return hour * 60 + minute
+
+def _resolve_local_range(start_text, end_text):
+    """Resolve a time range into (start, end, ambiguous) minutes, inferring am/pm where needed."""
+    start, start_meridiem = _parse_local_time(start_text)
+    end, end_meridiem = _parse_local_time(end_text)
+    if start is None or end is None:
+        return None
+    
+    ambiguous = False
+    if start_meridiem and end_meridiem:
+        start, end = _apply_meridiem(start, start_meridiem), _apply_meridiem(end, end_meridiem)
+    elif end_meridiem:
+        # "2-5 pm" shares the meridiem, "11-2 pm" crosses noon
+        end = _apply_meridiem(end, end_meridiem)
+        start = _apply_meridiem(start, end_meridiem)
+        if start >= end:
+            start = _apply_meridiem(_parse_local_time(start_text)[0], 'a')
+    elif start_meridiem:
+        start = _apply_meridiem(start, start_meridiem)
+        end = _apply_meridiem(end, start_meridiem)
+        if end <= start:
+            end = _apply_meridiem(_parse_local_time(end_text)[0], 'p')
+    elif start >= 13 * 60 or end >= 13 * 60 or start < 60:
+        # Unambiguous 24-hour clock
+        pass
+    else:
+        # Bare "2-5" style ranges: treat early hours as afternoon but flag the guess
+        ambiguous = True
+        if start < 7 * 60:
+            start += 12 * 60
+        if end <= start:
+            end += 12 * 60
     
-    return [(target_day, target_start_time, target_end_time)]
+    if end == 0 or end == 24 * 60:
+        end = 24 * 60 - 1
+    if not 0 <= start < end < 24 * 60:
+        return None
+    return start, end, ambiguous
 
-def parse_teams_calendar(calendar_data, attendee_timezone=None, target_timezone="UTC"):
-    """Parse Teams calendar data to determine available time slots."""
-    # For this example, assuming a simplified format where calendar_data is a list of
-    # {'day': 0-6, 'start': (hour, minute), 'end': (hour, minute)} for busy slots
-    busy_slots = []
+def parse_availability_local(availability_text):
+    """Parse availability text with a local grammar and return (availability, confidence).
     
-    # Process and convert timezone for each busy slot
-    for slot in calendar_data:
-        if attendee_timezone and target_timezone:
-            converted_slots = convert_to_target_timezone(
-                slot['day'], slot['start'], slot['end'], 
-                attendee_timezone, target_timezone
-            )
-            for conv_day, conv_start, conv_end in converted_slots:
-                busy_slots.append({
-                    'day': conv_day,
-                    'start': conv_start,
-                    'end': conv_end
-                })
+    Confidence is in [0, 1]: the share of meaningful words the grammar understood,
+    reduced for every assumption made (missing days or times, am/pm guesses).
+    """
+    text = availability_text.lower()
+    tokens = []  # ('days', [codes]) or ('times', [(start, end)])
+    covered = []
+    penalty = 1.0
+    
+    for match in LOCAL_AVAILABILITY_PATTERN.finditer(text):
+        covered.append(match.span())
+        if match.group('day_from'):
+            first = _local_day_code(match.group('day_from'))
+            last = _local_day_code(match.group('day_to'))
+            days = [(first + offset) % 7 for offset in range((last - first) % 7 + 1)]
+            tokens.append(('days', days))
+        elif match.group('group'):
+            key = match.group('group').split()[0]
+            if key not in LOCAL_DAY_GROUPS and key.endswith('s'):
+                # Plural "weekdays"/"weekends", without turning "business" into "busine"
+                key = key[:-1]
+            key = 'weekday' if key.startswith('week') and key != 'weekend' else key
+            key = 'every' if key.startswith('every') else key
+            tokens.append(('days', LOCAL_DAY_GROUPS[key]))
+        elif match.group('day'):
+            tokens.append(('days', [_local_day_code(match.group('day'))]))
+        elif match.group('between_start') or match.group('range_start'):
+            start_text = match.group('between_start') or match.group('range_start')
+            end_text = match.group('between_end') or match.group('range_end')
+            resolved = _resolve_local_range(start_text, end_text)
+            if resolved is None:
+                return [], 0.0
+            start, end, ambiguous = resolved
+            if ambiguous:
+                penalty *= 0.85
+            tokens.append(('times', [(start, end)]))
+        elif match.group('open_word'):
+            minutes, meridiem = _parse_local_time(match.group('open_time'))
+            if minutes is None:
+                return [], 0.0
+            if meridiem is None and minutes < 7 * 60:
+                # "after 2" almost always means the afternoon
+                minutes += 12 * 60
+                penalty *= 0.85
+            else:
+                minutes = _apply_meridiem(minutes, meridiem)
+            if match.group('open_word') in ('after', 'from', 'since'):
+                end = 17 * 60 if minutes < 17 * 60 else 24 * 60 - 1
+                window = (minutes, end)
+            else:
+                window = (9 * 60, minutes)
+            if window[0] >= window[1]:
+                return [], 0.0
+            penalty *= 0.95
+            tokens.append(('times', [window]))
+        elif match.group('part'):
+            penalty *= 0.9
+            tokens.append(('times', [LOCAL_DAY_PARTS[match.group('part').rstrip('s')]]))
+    
+    # Measure how much of the sentence the grammar actually understood
+    words = [(m.group(), m.start()) for m in re.finditer(r"[a-z]+|\d+", text)]
+    significant = 0
+    understood = 0
+    for word, position in words:
+        if word in LOCAL_NEGATION_WORDS:
+            return [], 0.0
+        is_covered = any(start <= position < end for start, end in covered)
+        if word in LOCAL_FILLER_WORDS and not is_covered:
+            continue
+        significant += 1
+        understood += is_covered
+    if not tokens or not significant:
+        return [], 0.0
+    confidence = understood / significant * penalty
+    
+    # Collapse consecutive tokens of the same kind into runs and pair day runs with time runs
+    runs = []
+    for kind, values in tokens:
+        if runs and runs[-1][0] == kind:
+            runs[-1][1].extend(values)
         else:
-            busy_slots.append(slot)
+            runs.append((kind, list(values)))
+    
+    if len(runs) % 2:
+        # A trailing run without a partner: assume working days or working hours
+        confidence *= 0.7
+        missing_kind = 'times' if runs[-1][0] == 'days' else 'days'
+        runs.append((missing_kind, [(9 * 60, 17 * 60)] if missing_kind == 'times' else [0, 1, 2, 3, 4]))
     
-    # Create availability as the inverse of busy slots (simplified)
     availability = []
-    for day in range(7):  # 0-6 for Monday-Sunday
-        day_busy = [slot for slot in busy_slots if slot['day'] == day]
+    for first, second in zip(runs[::2], runs[1::2]):
+        days, windows = (first[1], second[1]) if first[0] == 'days' else (second[1], first[1])
+        for day in sorted(set(days)):
+            for start, end in windows:
+                window = (day, divmod(start, 60), divmod(end, 60))
+                if window not in availability:
+                    availability.append(window)
+    
+    return availability, round(confidence, 3)
+
+@lru_cache(maxsize=4096)
+def timezone_offset_table(source_tz, target_tz, anchor_date):
+    """Return a read-only (7, OFFSET_STEPS_PER_DAY) array of minutes that turn source-local into target-local time.
+    
+    Row d, column q holds the offset for quarter hour q (minute // OFFSET_STEP_MINUTES)
+    of the next occurrence of weekday d on or after anchor_date. Offsets are sampled
+    hourly; only hours whose two ends differ are resolved per quarter hour.
+    """
+    source = get_timezone(source_tz)
+    target = get_timezone(target_tz)
+    
+    def offset_at(local_dt):
+        source_dt = source.localize(local_dt)
+        return (source_dt.astimezone(target).utcoffset() - source_dt.utcoffset()).total_seconds() // 60
+    
+    steps_per_hour = 60 // OFFSET_STEP_MINUTES
+    table = np.zeros((7, OFFSET_STEPS_PER_DAY), dtype=np.int32)
+    for days_ahead in range(7):
+        source_date = anchor_date + timedelta(days=days_ahead)
+        midnight = datetime.combine(source_date, datetime.min.time())
+        hourly = [offset_at(midnight + timedelta(hours=hour)) for hour in range(25)]
+        row = table[source_date.weekday()]
+        for hour in range(24):
+            first_step = hour * steps_per_hour
+            if hourly[hour] == hourly[hour + 1]:
+                row[first_step:first_step + steps_per_hour] = hourly[hour]
+            else:
+                # The offset changes inside this hour, so find where per quarter hour
+                for step in range(first_step, first_step + steps_per_hour):
+                    row[step] = offset_at(midnight + timedelta(minutes=step * OFFSET_STEP_MINUTES))
+    table.setflags(write=False)
+    return table
+
+def convert_windows_to_target_timezone(windows, source_tz, target_tz, anchor_date=None):
+    """Convert many (day, start, end) windows between timezones with offset table lookups."""
+    if anchor_date is None:
+        anchor_date = datetime.now().date()
+    table = timezone_offset_table(source_tz, target_tz, anchor_date)
+    
+    converted = []
+    for day_of_week, start_time, end_time in windows:
+        local_start = time_to_minutes(start_time)
+        local_end = time_to_minutes(end_time)
+        start = day_of_week * MINUTES_PER_DAY + local_start + int(table[day_of_week, local_start // OFFSET_STEP_MINUTES])
+        end = day_of_week * MINUTES_PER_DAY + local_end + int(table[day_of_week, local_end // OFFSET_STEP_MINUTES])
         
-        # Default working hours (9am to 5pm)
-        work_start = (9, 0)
-        work_end = (17, 0)
+        target_day, start_minutes = divmod(start, MINUTES_PER_DAY)
+        end_day, end_minutes = divmod(end, MINUTES_PER_DAY)
+        target_day %= 7
+        target_start_time = divmod(start_minutes, 60)
+        target_end_time = divmod(end_minutes, 60)
         
-        # Find available slots between busy meetings
-        if not day_busy:
-            # If no meetings, entire work day is available
-            availability.append((day, work_start, work_end))
+        # Handle day change
+        if end_day != start // MINUTES_PER_DAY:
+            # If time spans midnight, return two separate slots
+            converted.append((target_day, target_start_time, (23, 59)))
+            converted.append(((target_day + 1) % 7, (0, 0), target_end_time))
         else:
-            # Sort busy slots by start time
-            day_busy.sort(key=lambda x: x['start'])
-            
-            # Check for availability at the start of the day
-            if day_busy[0]['start'] > work_start:
-                availability.append((day, work_start, day_busy[0]['start']))
-            
-            # Check for gaps between meetings
-            for i in range(len(day_busy) - 1):
-                if day_busy[i]['end'] < day_busy[i + 1]['start']:
-                    availability.append((day, day_busy[i]['end'], day_busy[i + 1]['start']))
-            
-            # Check for availability at the end of the day
-            if day_busy[-1]['end'] < work_end:
-                availability.append((day, day_busy[-1]['end'], work_end))
+            converted.append((target_day, target_start_time, target_end_time))
+    
+    return converted
+
+def convert_to_target_timezone(day_of_week, start_time, end_time, source_tz, target_tz, as_of=None):
+    """Convert time from source timezone to target timezone, accounting for day changes.
+    
+    The weekday is anchored to its next occurrence on or after as_of (default: today);
+    pass as_of for results that do not depend on when the process runs.
+    """
+    anchor_date = as_date(as_of) if as_of is not None else None
+    return convert_windows_to_target_timezone([(day_of_week, start_time, end_time)], source_tz, target_tz, anchor_date)
+
+def as_date(value):
+    """Return the date part of a datetime, or the value itself if it already is a date."""
+    return value.date() if isinstance(value, datetime) else value
+
+def date_timezone_offsets(source_tz, target_tz, date):
+    """Return the per-quarter-hour source-to-target offsets (minutes) that apply on a concrete source date."""
+    week_start = date - timedelta(days=date.weekday())
+    return timezone_offset_table(source_tz, target_tz, week_start)[date.weekday()]
+
+def parse_teams_calendar(calendar_data, attendee_timezone=None, target_timezone="UTC", as_of=None,
+                         working_hours=None):
+    """Parse Teams calendar data to determine available time slots.
+    
+    working_hours is {day code: minute intervals}; it defaults to the calendar config's default profile.
+    """
+    # For this example, assuming a simplified format where calendar_data is a list of
+    # {'day': 0-6, 'start': (hour, minute), 'end': (hour, minute)} for busy slots
+    busy_slots = []
+    
+    # Process and convert timezone for each busy slot
+    if attendee_timezone and target_timezone:
+        converted_slots = convert_windows_to_target_timezone(
+            [(slot['day'], slot['start'], slot['end']) for slot in calendar_data],
+            attendee_timezone, target_timezone,
+            as_date(as_of) if as_of is not None else None
+        )
+        for conv_day, conv_start, conv_end in converted_slots:
+            busy_slots.append({
+                'day': conv_day,
+                'start': conv_start,
+                'end': conv_end
+            })
+    else:
+        busy_slots.extend(calendar_data)
+    
+    # Index the busy slots once as merged minute-of-week intervals, so overlapping
+    # and nested meetings are handled
+    busy_index = BusyIndex(
+        (slot['day'] * MINUTES_PER_DAY + time_to_minutes(slot['start']),
+         slot['day'] * MINUTES_PER_DAY + time_to_minutes(slot['end']))
+        for slot in busy_slots
+    )
+    
+    if working_hours is None:
+        working_hours = get_calendar_config().default_working_hours
+    
+    # Create availability as the inverse of busy slots within working hours
+    availability = []
+    for day in sorted(working_hours):  # 0-6 for Monday-Sunday
+        day_offset = day * MINUTES_PER_DAY
+        for work_start, work_end in working_hours[day]:
+            for start, end in busy_index.free_gaps(day_offset + work_start, day_offset + work_end):
+                availability.append((day, divmod(start - day_offset, 60), divmod(end - day_offset, 60)))
     
     return availability
 
-def get_date_range(start_date, end_date):
-    """Generate a list of dates between start_date and end_date."""
-    date_range = []
+def time_to_minutes(time_tuple):
+    """Convert an (hour, minute) tuple to minutes since midnight."""
+    return time_tuple[0] * 60 + time_tuple[1]
+
+def merge_intervals(intervals):
+    """Merge overlapping or touching (start, end) intervals into a sorted, disjoint list.
+    
+    Intervals are half-open and unit-agnostic: minutes, seconds or any other
+    integer resolution works as long as every interval uses the same one.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def intersect_intervals(first, second):
+    """Intersect two sorted, disjoint interval lists with a two-pointer sweep."""
+    common = []
+    i = j = 0
+    while i < len(first) and j < len(second):
+        start = max(first[i][0], second[j][0])
+        end = min(first[i][1], second[j][1])
+        if start < end:
+            common.append((start, end))
+        # Advance whichever interval finishes first
+        if first[i][1] < second[j][1]:
+            i += 1
+        else:
+            j += 1
+    return common
+
+def intersect_interval_sets(interval_sets):
+    """Return the maximal intervals common to every sorted, disjoint interval list."""
+    if not interval_sets:
+        return []
+    common = interval_sets[0]
+    for intervals in interval_sets[1:]:
+        if not common:
+            break
+        common = intersect_intervals(common, intervals)
+    return list(common)
+
+def subtract_intervals(intervals, removed):
+    """Remove a sorted, disjoint interval list from another one."""
+    remaining = []
+    j = 0
+    for start, end in intervals:
+        # Skip removed intervals that end before this one starts
+        while j < len(removed) and removed[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(removed) and removed[k][0] < end:
+            if removed[k][0] > start:
+                remaining.append((start, removed[k][0]))
+            start = max(start, removed[k][1])
+            k += 1
+        if start < end:
+            remaining.append((start, end))
+    return remaining
+
+class BusyIndex:
+    """Sorted, merged busy intervals with O(log n) conflict checks and free-gap enumeration.
+    
+    Intervals are half-open integers in any single unit, e.g. minutes of the week or
+    epoch seconds. Overlapping, nested and touching intervals are merged on build.
+    """
+    
+    def __init__(self, intervals=()):
+        merged = merge_intervals(intervals)
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+    
+    @classmethod
+    def from_sorted(cls, starts, ends):
+        """Build from already merged, sorted start and end sequences without re-merging."""
+        index = cls()
+        index.starts = list(starts)
+        index.ends = list(ends)
+        return index
+    
+    def __len__(self):
+        return len(self.starts)
+    
+    def is_free(self, start, end):
+        """Return True if no busy interval overlaps [start, end)."""
+        # First busy interval that ends after start; it is the only one that can overlap
+        i = bisect_right(self.ends, start)
+        return i == len(self.starts) or self.starts[i] >= end
+    
+    def busy_within(self, start, end):
+        """Return the busy intervals overlapping [start, end), clipped to it."""
+        first = bisect_right(self.ends, start)
+        last = bisect_left(self.starts, end)
+        return [
+            (max(busy_start, start), min(busy_end, end))
+            for busy_start, busy_end in zip(self.starts[first:last], self.ends[first:last])
+        ]
+    
+    def free_gaps(self, start, end):
+        """Return the free intervals inside [start, end)."""
+        gaps = []
+        cursor = start
+        for busy_start, busy_end in self.busy_within(start, end):
+            if busy_start > cursor:
+                gaps.append((cursor, busy_start))
+            cursor = busy_end
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+def generate_slot_starts(intervals, duration, step):
+    """Yield start offsets of every slot of the given duration that fits in the intervals."""
+    for start, end in intervals:
+        yield from range(start, end - duration + 1, step)
+
+def iter_dates(start_date, end_date=None):
+    """Lazily yield each date from start_date to end_date inclusive, without end if end_date is None."""
     current_date = start_date
-    while current_date <= end_date:
-        date_range.append(current_date)
+    while end_date is None or current_date <= end_date:
+        yield current_date
         current_date += timedelta(days=1)
-    return date_range
 
-def find_available_slots(attendees, date_range, target_timezone="UTC", duration_minutes=60):
-    """Find time slots where all attendees are available."""
-    all_availability = []
+def get_date_range(start_date, end_date):
+    """Generate a list of dates between start_date and end_date."""
+    return list(iter_dates(start_date, end_date))
+
+def parse_availability_text(availability_text, attendee_timezone=None):
+    """Parse availability text locally, asking Claude only when the local grammar is unsure."""
+    local_availability, confidence = parse_availability_local(availability_text)
+    if confidence >= LOCAL_PARSER_MIN_CONFIDENCE:
+        return local_availability
+    
+    try:
+        # Try to use Claude API for parsing
+        return parse_availability_with_claude(availability_text, attendee_timezone)
+    except Exception as e:
+        print(f"Claude API error: {e}. Using fallback parser.")
+        # Fall back to the best local parse we have
+        return local_availability or parse_availability_fallback(availability_text)
+
+def convert_weekly_intervals(weekly_intervals, source_tz, date, target_timezone="UTC"):
+    """Convert weekly local minute intervals onto one concrete date in the target timezone.
+    
+    Returns merged intervals as minutes of that date in the target timezone.
+    """
+    date = as_date(date)
+    if not source_tz or not target_timezone:
+        return weekly_intervals.get(date.weekday(), [])
+    
+    intervals = []
+    # UTC offsets differ by at most 26 hours, so only nearby local dates can overlap this one
+    for day_offset in range(-2, 3):
+        source_date = date + timedelta(days=day_offset)
+        local_intervals = weekly_intervals.get(source_date.weekday())
+        if not local_intervals:
+            continue
+        offsets = date_timezone_offsets(source_tz, target_timezone, source_date)
+        shift = day_offset * MINUTES_PER_DAY
+        for start, end in local_intervals:
+            start = max(start + int(offsets[start // OFFSET_STEP_MINUTES]) + shift, 0)
+            end = min(end + int(offsets[min(end // OFFSET_STEP_MINUTES, OFFSET_STEPS_PER_DAY - 1)]) + shift,
+                      MINUTES_PER_DAY)
+            if start < end:
+                intervals.append((start, end))
+    
+    return merge_intervals(intervals)
+
+# Optional JSON file overriding DEFAULT_CALENDAR_CONFIG; edits are picked up without a restart
+CALENDAR_CONFIG_PATH = os.environ.get("TIME_SLOTS_CALENDAR_CONFIG")
+
+# Working hours and time off, all in each attendee's local time.
+#   working_hours: profile name -> {day code (0=Monday): [["HH:MM", "HH:MM"], ...]}
+#   default_working_hours: profile for attendees without their own "working_hours"
+#   holidays: region -> ["YYYY-MM-DD", ...], applied through an attendee's "region"
+#   time_off: attendee name -> [{"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}], whole days, inclusive
+# Attendees may also carry inline "working_hours" (a profile name or mapping) and "time_off".
+DEFAULT_CALENDAR_CONFIG = {
+    "working_hours": {"standard": {str(day): [["09:00", "17:00"]] for day in range(5)}},
+    "default_working_hours": "standard",
+    "holidays": {},
+    "time_off": {},
+}
+
+def compile_working_hours(profile):
+    """Compile a {day: [["HH:MM", "HH:MM"], ...]} profile into merged minute intervals per day code."""
+    return {
+        int(day): merge_intervals(
+            (parse_clock(start), parse_clock(end) if end != "24:00" else MINUTES_PER_DAY)
+            for start, end in windows
+        )
+        for day, windows in profile.items()
+    }
+
+def parse_date_ranges(ranges):
+    """Parse [{"start": ..., "end": ...}] or bare "YYYY-MM-DD" entries into inclusive (start, end) dates."""
+    parsed = []
+    for entry in ranges:
+        if isinstance(entry, str):
+            entry = {"start": entry, "end": entry}
+        start = datetime.strptime(entry["start"], '%Y-%m-%d').date()
+        end = datetime.strptime(entry.get("end", entry["start"]), '%Y-%m-%d').date()
+        parsed.append((start, end))
+    return parsed
+
+class CalendarConfig:
+    """Working-hour profiles, regional holidays and time off, compiled once per config file."""
+    
+    def __init__(self, config=None):
+        config = {**DEFAULT_CALENDAR_CONFIG, **(config or {})}
+        # Configured profiles extend the built-in "standard" one rather than replacing it
+        profiles = {**DEFAULT_CALENDAR_CONFIG["working_hours"], **config["working_hours"]}
+        self.working_hours = {name: compile_working_hours(profile) for name, profile in profiles.items()}
+        self.default_working_hours = self.working_hours[config["default_working_hours"]]
+        self.holidays = {
+            region: parse_date_ranges(dates) for region, dates in config["holidays"].items()
+        }
+        self.time_off = {name: parse_date_ranges(ranges) for name, ranges in config["time_off"].items()}
+    
+    @classmethod
+    def from_file(cls, path):
+        with open(path) as f:
+            return cls(json.load(f))
     
-    for date in date_range:
-        # Get day of week (0-6, where 0 is Monday)
-        day_of_week = date.weekday()
+    def working_hours_for(self, attendee):
+        """Return an attendee's working hours as {day code: merged minute intervals}."""
+        profile = attendee.get('working_hours')
+        if profile is None:
+            return self.default_working_hours
+        if isinstance(profile, str):
+            if profile not in self.working_hours:
+                print(f"Unknown working hours profile {profile}, using the default")
+                return self.default_working_hours
+            return self.working_hours[profile]
+        return compile_working_hours(profile)
+    
+    def days_off_for(self, attendee):
+        """Return an attendee's holidays and time off as inclusive (start, end) local date ranges."""
+        regions = attendee.get('region') or []
+        if isinstance(regions, str):
+            regions = [regions]
+        days_off = [days for region in regions for days in self.holidays.get(region, [])]
+        days_off.extend(self.time_off.get(attendee.get('name'), []))
+        days_off.extend(parse_date_ranges(attendee.get('time_off', [])))
+        return days_off
+
+_calendar_config_lock = threading.Lock()
+_calendar_config_state = {"path": None, "mtime": None, "value": None}
+
+def get_calendar_config(path=None):
+    """Return the active CalendarConfig, reloading the config file whenever it changes on disk."""
+    return load_hot_config(
+        _calendar_config_state, _calendar_config_lock, path or CALENDAR_CONFIG_PATH, CalendarConfig,
+        "calendar config"
+    )
+
+def local_days_to_epochs(day_ranges, timezone_name):
+    """Convert inclusive local date ranges into (start, end) epoch-second intervals in that timezone."""
+    tz = get_timezone(timezone_name) if timezone_name else pytz.utc
+    return [
+        (int(tz.localize(datetime(start.year, start.month, start.day)).timestamp()),
+         int(tz.localize(datetime(end.year, end.month, end.day) + timedelta(days=1)).timestamp()))
+        for start, end in day_ranges
+    ]
+
+def epoch_index_minutes_on(index, date, target_timezone="UTC"):
+    """Return the epoch intervals of a BusyIndex on a date, as minutes of that date in the target timezone."""
+    tz = get_timezone(target_timezone)
+    day_start = tz.localize(datetime(date.year, date.month, date.day))
+    day_end = tz.localize(datetime(date.year, date.month, date.day) + timedelta(days=1))
+    
+    minutes = []
+    for start, end in index.busy_within(int(day_start.timestamp()), int(day_end.timestamp())):
+        # Wall-clock minutes of the target date; busy_within already clipped to the day
+        local_start = datetime.fromtimestamp(start, tz)
+        local_end = datetime.fromtimestamp(end, tz)
+        start_minutes = local_start.hour * 60 + local_start.minute
+        end_minutes = (local_end.hour * 60 + local_end.minute + (local_end.second > 0)
+                       if local_end < day_end else MINUTES_PER_DAY)
+        minutes.append((start_minutes, end_minutes))
+    return merge_intervals(minutes)
+
+class AttendeeAvailability:
+    """An attendee's recurring weekly availability, kept in the attendee's own timezone.
+    
+    Conversion to the target timezone happens per concrete date in intervals_on, so
+    DST changes inside the requested range are honoured and results do not depend on
+    the current date.
+    """
+    
+    def __init__(self, weekly_intervals, timezone=None, weekly_busy=None, busy_events=None, time_off=None):
+        # {day of week: merged (start, end) minute intervals in local time}
+        self.weekly_intervals = weekly_intervals
+        self.timezone = timezone
+        # Known meetings in the same shape, used for buffer scoring
+        self.weekly_busy = weekly_busy or {}
+        self.weekly_busy_index = BusyIndex(
+            (day * MINUTES_PER_DAY + start, day * MINUTES_PER_DAY + end)
+            for day, intervals in self.weekly_busy.items() for start, end in intervals
+        )
+        # Dated meetings (e.g. from an .ics export), indexed by epoch seconds
+        self.busy_events = None
+        if busy_events is not None:
+            self.busy_events = BusyIndex.from_sorted(*(np.asarray(values).tolist() for values in busy_events))
+        # Holidays and time off as (start, end) epoch-second intervals
+        self.time_off = BusyIndex(time_off or ())
+    
+    def is_free(self, start, end):
+        """Return True if no known meeting overlaps [start, end), given as timezone-aware datetimes."""
+        if self.busy_events is not None and not self.busy_events.is_free(int(start.timestamp()), int(end.timestamp())):
+            return False
         
-        # Check each attendee's availability for this day
-        day_slots = defaultdict(int)  # Count of attendees available for each time slot
+        local_start = start.astimezone(get_timezone(self.timezone)) if self.timezone else start
+        week_start = local_start.weekday() * MINUTES_PER_DAY + local_start.hour * 60 + local_start.minute
+        week_end = week_start + int((end - start).total_seconds() // 60)
+        week_minutes = 7 * MINUTES_PER_DAY
+        if not self.weekly_busy_index.is_free(week_start, min(week_end, week_minutes)):
+            return False
+        # A slot running past Sunday midnight continues into Monday
+        return week_end <= week_minutes or self.weekly_busy_index.is_free(0, week_end - week_minutes)
+    
+    def events_on(self, date, target_timezone="UTC"):
+        """Return the dated busy events on a date, as minutes of that date in the target timezone."""
+        if not self.busy_events:
+            return []
+        return epoch_index_minutes_on(self.busy_events, date, target_timezone)
+    
+    def time_off_on(self, date, target_timezone="UTC"):
+        """Return holidays and time off on a date, as minutes of that date in the target timezone."""
+        if not self.time_off:
+            return []
+        return epoch_index_minutes_on(self.time_off, date, target_timezone)
+    
+    def time_off_mask(self, date_range, target_timezone="UTC"):
+        """Return a boolean (days x 1440) mask of the minutes the attendee is off."""
+        mask = np.zeros((len(date_range), MINUTES_PER_DAY), dtype=bool)
+        if self.time_off:
+            for day_index, date in enumerate(date_range):
+                for start, end in self.time_off_on(date, target_timezone):
+                    mask[day_index, start:end] = True
+        return mask
+    
+    def intervals_on(self, date, target_timezone="UTC", include_time_off=True):
+        """Return merged free intervals on a date, as minutes of that date in the target timezone.
         
-        for attendee in attendees:
-            # Combine availability from text and calendar
-            combined_availability = []
-            
-            attendee_timezone = attendee.get('timezone')
-            
-            if 'availability_text' in attendee and attendee['availability_text']:
-                try:
-                    # Try to use Claude API for parsing
-                    text_availability = parse_availability_with_claude(
-                        attendee['availability_text'], attendee_timezone
-                    )
-                except Exception as e:
-                    print(f"Claude API error: {e}. Using fallback parser.")
-                    # Fallback to regex-based parsing
-                    text_availability = parse_availability_fallback(attendee['availability_text'])
-                
-                # Convert timezone if needed
-                if attendee_timezone and target_timezone:
-                    converted_availability = []
-                    for avail_day, start_time, end_time in text_availability:
-                        converted_slots = convert_to_target_timezone(
-                            avail_day, start_time, end_time, 
-                            attendee_timezone, target_timezone
-                        )
-                        converted_availability.extend(converted_slots)
-                    combined_availability.extend(converted_availability)
-                else:
-                    combined_availability.extend(text_availability)
-            
-            if 'teams_calendar' in attendee and attendee['teams_calendar']:
-                calendar_availability = parse_teams_calendar(
-                    attendee['teams_calendar'], 
-                    attendee_timezone, 
-                    target_timezone
-                )
-                combined_availability.extend(calendar_availability)
-            
-            # If no availability info is provided, assume standard work hours in their timezone
-            if not combined_availability:
-                print(f"No availability info for {attendee.get('name', 'an attendee')}. Assuming standard work hours.")
-                # Standard work hours: Mon-Fri, 9am-5pm
-                for day in range(5):  # Monday to Friday
-                    if attendee_timezone and target_timezone:
-                        converted_slots = convert_to_target_timezone(
-                            day, (9, 0), (17, 0), 
-                            attendee_timezone, target_timezone
-                        )
-                        combined_availability.extend(converted_slots)
-                    else:
-                        combined_availability.append((day, (9, 0), (17, 0)))
-            
-            # Check if attendee is available on this day
-            for avail_day, start_time, end_time in combined_availability:
-                if avail_day == day_of_week:
-                    # Convert to minutes for easier calculation
-                    start_minutes = start_time[0] * 60 + start_time[1]
-                    end_minutes = end_time[0] * 60 + end_time[1]
-                    
-                    # Check each potential meeting slot (30-minute increments)
-                    for slot_start in range(start_minutes, end_minutes - duration_minutes + 1, 30):
-                        slot_key = (date, slot_start)
-                        day_slots[slot_key] += 1
+        include_time_off=False skips the holiday/time-off subtraction for callers that apply
+        time_off_mask themselves.
+        """
+        intervals = convert_weekly_intervals(self.weekly_intervals, self.timezone, date, target_timezone)
+        if self.busy_events is not None:
+            intervals = subtract_intervals(intervals, self.events_on(date, target_timezone))
+        if include_time_off and self.time_off:
+            intervals = subtract_intervals(intervals, self.time_off_on(date, target_timezone))
+        return intervals
+    
+    def busy_on(self, date, target_timezone="UTC"):
+        """Return merged busy intervals on a date, as minutes of that date in the target timezone."""
+        busy = convert_weekly_intervals(self.weekly_busy, self.timezone, date, target_timezone)
+        if self.busy_events is not None:
+            busy = merge_intervals(busy + self.events_on(date, target_timezone))
+        return busy
+
+def resolve_attendee_availability(attendee, parsed_texts=None, date_range=None):
+    """Resolve an attendee's text and calendar availability into an AttendeeAvailability.
+    
+    parsed_texts optionally maps (availability_text, timezone) to an already parsed result.
+    date_range bounds the recurrence expansion of an 'ics_calendar' file and is required to use one.
+    """
+    # Combine availability from text and calendar, all in the attendee's local time
+    combined_availability = []
+    
+    attendee_timezone = attendee.get('timezone')
+    calendar_config = get_calendar_config()
+    working_hours = calendar_config.working_hours_for(attendee)
+    
+    if 'availability_text' in attendee and attendee['availability_text']:
+        text_key = (attendee['availability_text'], attendee_timezone)
+        if parsed_texts is not None and text_key in parsed_texts:
+            text_availability = parsed_texts[text_key]
+        else:
+            text_availability = parse_availability_text(*text_key)
+        combined_availability.extend(text_availability)
+    
+    weekly_busy = defaultdict(list)
+    if 'teams_calendar' in attendee and attendee['teams_calendar']:
+        combined_availability.extend(parse_teams_calendar(attendee['teams_calendar'], working_hours=working_hours))
+        for slot in attendee['teams_calendar']:
+            weekly_busy[slot['day']].append((time_to_minutes(slot['start']), time_to_minutes(slot['end'])))
+    
+    busy_events = None
+    if attendee.get('ics_calendar'):
+        if date_range:
+            busy_events = read_busy_intervals(
+                attendee['ics_calendar'], as_date(date_range[0]), as_date(date_range[-1]),
+                attendee_timezone or "UTC"
+            )
+        else:
+            print(f"Ignoring the calendar file of {attendee.get('name', 'an attendee')}: no date range given")
+    
+    # If no availability info is provided, assume their working hours in their timezone
+    if not combined_availability:
+        print(f"No availability info for {attendee.get('name', 'an attendee')}. Assuming standard work hours.")
+        combined_availability.extend(
+            (day, divmod(start, 60), divmod(end, 60))
+            for day, windows in working_hours.items() for start, end in windows
+        )
+    
+    # Group windows by day of week as merged minute intervals
+    weekly_windows = defaultdict(list)
+    for avail_day, start_time, end_time in combined_availability:
+        weekly_windows[avail_day].append((time_to_minutes(start_time), time_to_minutes(end_time)))
+    
+    return AttendeeAvailability(
+        {day: merge_intervals(windows) for day, windows in weekly_windows.items()},
+        attendee_timezone,
+        {day: merge_intervals(windows) for day, windows in weekly_busy.items()},
+        busy_events,
+        local_days_to_epochs(calendar_config.days_off_for(attendee), attendee_timezone)
+    )
+
+def resolve_attendees(attendees, date_range=None):
+    """Resolve all attendees, parsing every distinct availability text concurrently."""
+    text_keys = [
+        (attendee['availability_text'], attendee.get('timezone'))
+        for attendee in attendees if attendee.get('availability_text')
+    ]
+    parsed_texts = claude_client.map_unique(parse_availability_text, text_keys)
+    return [
+        resolve_attendee_availability(attendee, parsed_texts, date_range) for attendee in attendees
+    ]
+
+def find_slot_candidates(attendees, date_range, target_timezone="UTC", duration_minutes=60, step_minutes=30,
+                         availabilities=None):
+    """Find slots where all attendees are available as (day_indices, start_minutes, attendee_counts) arrays.
+    
+    Slots stay integer offsets into date_range until they are rendered with render_slots.
+    availabilities may pass in the result of resolve_attendees(attendees) to avoid re-parsing.
+    """
+    day_indices = []
+    start_minutes = []
+    
+    # Parse every attendee once up front; the per-date sweep below only reads these
+    if availabilities is None:
+        availabilities = resolve_attendees(attendees, date_range)
+    
+    for day_index, date in enumerate(date_range):
+        # Convert against this concrete date so DST changes inside the range are honoured
+        common_intervals = intersect_interval_sets(
+            [availability.intervals_on(date, target_timezone) for availability in availabilities]
+        )
         
         # Add slots where all attendees are available
-        for slot_key, count in day_slots.items():
-            if count == len(attendees):
-                date, start_minutes = slot_key
-                all_availability.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'start_time': f"{start_minutes // 60:02d}:{start_minutes % 60:02d}",
-                    'end_time': f"{(start_minutes + duration_minutes) // 60:02d}:{(start_minutes + duration_minutes) % 60:02d}",
-                    'attendees': len(attendees),
-                    'timezone': target_timezone
-                })
-    
-    return all_availability
+        for start in generate_slot_starts(common_intervals, duration_minutes, step_minutes):
+            day_indices.append(day_index)
+            start_minutes.append(start)
+    
+    counts = np.full(len(start_minutes), len(attendees), dtype=np.int32)
+    return np.array(day_indices, dtype=np.intp), np.array(start_minutes, dtype=np.int32), counts
 
-def analyze_meeting_preferences_with_claude(attendees_info, target_timezone="UTC"):
-    """Use Claude API to analyze meeting preferences from attendee information."""
-    #api_key = os.environ.get("ANTHROPIC_API_KEY")
+def find_available_slots(attendees, date_range, target_timezone="UTC", duration_minutes=60, step_minutes=30):
+    """Find time slots where all attendees are available."""
+    date_range = list(date_range)
+    candidates = find_slot_candidates(attendees, date_range, target_timezone, duration_minutes, step_minutes)
+    return render_slots(date_range, *candidates, duration_minutes, target_timezone)
+
+def iter_slot_candidates(availabilities, dates, target_timezone="UTC", duration_minutes=60, step_minutes=30):
+    """Lazily yield (day_index, date, start_minutes array) for every date that has a common slot.
     
+    dates may be any iterable, including an unbounded one from iter_dates; only one
+    date is intersected at a time.
+    """
+    for day_index, date in enumerate(dates):
+        common_intervals = intersect_interval_sets(
+            [availability.intervals_on(date, target_timezone) for availability in availabilities]
+        )
+        starts = np.fromiter(
+            generate_slot_starts(common_intervals, duration_minutes, step_minutes), dtype=np.int32
+        )
+        if len(starts):
+            yield day_index, date, starts
+
+def render_slots(date_range, day_indices, start_minutes, attendee_counts, duration_minutes, target_timezone):
+    """Render slot candidate arrays into the public list of slot dicts."""
+    return [
+        format_slot(date_range[day_index], start, duration_minutes, count, target_timezone)
+        for day_index, start, count in zip(day_indices.tolist(), start_minutes.tolist(), attendee_counts.tolist())
+    ]
 
-    if not api_key:
+def format_slot(date, start_minutes, duration_minutes, attendee_count, target_timezone):
+    """Render a slot given as a minute offset into the public slot dict."""
+    end_minutes = start_minutes + duration_minutes
+    return {
+        'date': date.strftime('%Y-%m-%d'),
+        'start_time': f"{start_minutes // 60:02d}:{start_minutes % 60:02d}",
+        'end_time': f"{end_minutes // 60 % 24:02d}:{end_minutes % 60:02d}",
+        'attendees': attendee_count,
+        'timezone': target_timezone
+    }
+
+def build_availability_grid(availability, date_range, target_timezone="UTC"):
+    """Build a boolean (days x 1440) minute grid from an attendee's availability."""
+    grid = np.zeros((len(date_range), MINUTES_PER_DAY), dtype=bool)
+    for day_index, date in enumerate(date_range):
+        for start, end in availability.intervals_on(date, target_timezone, include_time_off=False):
+            grid[day_index, start:end] = True
+    # Holidays and time off come off the whole range in one masked operation
+    if availability.time_off:
+        grid &= ~availability.time_off_mask(date_range, target_timezone)
+    return grid
+
+def slot_fits(grid, duration_minutes):
+    """Mark every start minute whose following duration_minutes are all free (last axis is minutes)."""
+    if duration_minutes > grid.shape[-1]:
+        return np.zeros(grid.shape[:-1] + (0,), dtype=bool)
+    
+    # Windowed sums via a prefix sum; int16 is enough for 1440 minutes
+    prefix = np.zeros(grid.shape[:-1] + (grid.shape[-1] + 1,), dtype=np.int16)
+    np.cumsum(grid, axis=-1, dtype=np.int16, out=prefix[..., 1:])
+    window = prefix[..., duration_minutes:] - prefix[..., :-duration_minutes]
+    return window == duration_minutes
+
+def aligned_slot_starts(fits, step_minutes):
+    """Keep fitting starts that are a multiple of step_minutes from the start of their run.
+    
+    This matches generate_slot_starts, which steps from the start of each common interval.
+    """
+    minutes = np.arange(fits.shape[-1])
+    previous = np.zeros_like(fits)
+    previous[..., 1:] = fits[..., :-1]
+    run_starts = np.maximum.accumulate(np.where(fits & ~previous, minutes, 0), axis=-1)
+    return fits & ((minutes - run_starts) % step_minutes == 0)
+
+def find_slot_candidates_bitmap(attendees, date_range, target_timezone="UTC", duration_minutes=60,
+                                step_minutes=30, min_attendees=None, availabilities=None):
+    """Bitmap counterpart of find_slot_candidates; min_attendees enables k-of-n quorum mode."""
+    if not attendees or not date_range:
+        empty = np.zeros(0, dtype=np.int32)
+        return empty.astype(np.intp), empty, empty
+    
+    if availabilities is None:
+        availabilities = resolve_attendees(attendees, date_range)
+    # Shape: (attendees, days, minutes)
+    grids = np.stack([
+        build_availability_grid(availability, date_range, target_timezone)
+        for availability in availabilities
+    ])
+    
+    if min_attendees is None or min_attendees >= len(attendees):
+        fits = slot_fits(np.logical_and.reduce(grids, axis=0), duration_minutes)
+        counts = None
+    else:
+        # An attendee counts towards the quorum only if they are free for the whole slot
+        counts = slot_fits(grids, duration_minutes).sum(axis=0)
+        fits = counts >= min_attendees
+    
+    day_indices, start_minutes = np.nonzero(aligned_slot_starts(fits, step_minutes))
+    if counts is None:
+        attendee_counts = np.full(len(start_minutes), len(attendees), dtype=np.int32)
+    else:
+        attendee_counts = counts[day_indices, start_minutes].astype(np.int32)
+    return day_indices, start_minutes.astype(np.int32), attendee_counts
+
+def find_available_slots_bitmap(attendees, date_range, target_timezone="UTC", duration_minutes=60,
+                                step_minutes=30, min_attendees=None):
+    """Find available slots with NumPy minute grids; min_attendees enables k-of-n quorum mode."""
+    date_range = list(date_range)
+    candidates = find_slot_candidates_bitmap(
+        attendees, date_range, target_timezone, duration_minutes, step_minutes, min_attendees
+    )
+    return render_slots(date_range, *candidates, duration_minutes, target_timezone)
+
+def analyze_meeting_preferences_with_claude(attendees_info, target_timezone="UTC"):
+    """Use Claude API to analyze meeting preferences from attendee information."""
+    if not get_api_key():
         # Skip this step if no API key is available
         return None
     
-    headers = {
-        "x-api-key": api_key,
-        "anthropic-version": "2023-06-01",
-        "content-type": "application/json"
-    }
-    
     # Extract relevant information for analysis
     attendee_details = []
     for attendee in attendees_info:
@@ -454,7 +1530,7 @@ def analyze_meeting_preferences_with_claude(attendees_info, target_timezone="UTC
     """
     
     payload = {
-        "model": "claude-3-7-sonnet-20250219",
+        "model": CLAUDE_MODEL,
         "max_tokens": 1000,
         "messages": [
             {"role": "user", "content": prompt}
@@ -462,11 +1538,7 @@ def analyze_meeting_preferences_with_claude(attendees_info, target_timezone="UTC
     }
     
     try:
-        response = requests.post(
-            "https://api.anthropic.com/v1/messages",
-            headers=headers,
-            json=payload
-        )
+        response = claude_client.post_messages(payload)
         
         if response.status_code != 200:
             return None
@@ -534,6 +1606,308 @@ def score_time_slot(slot, preferred_times=None, preferred_days=None):
     
     return score
 
+# Day names in day-code order (0=Monday, 6=Sunday)
+DAY_NAMES = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+# Optional JSON file overriding DEFAULT_SCORING_CONFIG; edits are picked up without a restart
+SCORING_CONFIG_PATH = os.environ.get("TIME_SLOTS_SCORING_CONFIG")
+
+# Scoring weights. The defaults reproduce score_time_slot exactly; every extra
+# component is disabled until given a non-zero score.
+#   rules: added when the slot's weekday is in "days" (default: any) and its start
+#          minute is in ["start", "end") (default: whole day)
+#   preferred_*: bonus for Claude's preferred ranges (inclusive) and days
+#   attendee_comfort: added per attendee whose local time puts the slot outside [start, end)
+#   buffer: added when the slot starts or ends within "minutes" of someone's meeting
+#   recency: added per day between the start of the range and the slot
+#   fairness: per-attendee discomfort, in hours outside [start, end) local time,
+#             combined as "sum" (total) or "minimax" (worst-off attendee); null disables
+DEFAULT_SCORING_CONFIG = {
+    "rules": [
+        {"days": ["monday", "tuesday", "wednesday", "thursday", "friday"], "score": 10},
+        {"end": "08:00", "score": -20},
+        {"start": "16:01", "score": -10},
+        {"days": ["tuesday", "wednesday", "thursday"], "score": 3},
+    ],
+    "preferred_time_score": 15,
+    "preferred_day_score": 5,
+    "default_preferred_times": [["10:00", "12:00"], ["14:00", "16:00"]],
+    "default_preferred_days": ["monday", "tuesday", "wednesday", "thursday", "friday"],
+    "attendee_comfort": {"start": "09:00", "end": "18:00", "score": 0},
+    "buffer": {"minutes": 15, "score": 0},
+    "recency": {"score_per_day": 0},
+    "fairness": {"mode": None, "start": "09:00", "end": "18:00", "score_per_hour": -10},
+}
+
+FAIRNESS_MODES = ("sum", "minimax")
+
+def merge_config(defaults, overrides):
+    """Overlay a config onto its defaults; dict sections merge key by key, anything else is replaced."""
+    merged = dict(defaults)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(defaults.get(key), dict):
+            merged[key] = merge_config(defaults[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def parse_clock(value):
+    """Parse an "HH:MM" string into minutes since midnight."""
+    hour, minute = value.split(':')
+    return int(hour) * 60 + int(minute)
+
+class ScoringModel:
+    """Weighted slot scoring compiled from a declarative config into (weekday, minute) lookup tables.
+    
+    Scoring a batch of slots is a single fancy-index into the compiled table plus
+    optional per-attendee terms, so cost does not depend on the number of rules.
+    """
+    
+    def __init__(self, config=None):
+        # A partial section such as {"buffer": {"score": -5}} keeps the section's other defaults
+        self.config = merge_config(DEFAULT_SCORING_CONFIG, config)
+        self.base_table = self._compile_rules(self.config["rules"])
+        self.default_preferred_times = [
+            (divmod(parse_clock(start), 60), divmod(parse_clock(end), 60))
+            for start, end in self.config["default_preferred_times"]
+        ]
+        self.default_preferred_days = [DAY_NAMES.index(day) for day in self.config["default_preferred_days"]]
+        fairness_mode = self.config["fairness"]["mode"]
+        if fairness_mode is not None and fairness_mode not in FAIRNESS_MODES:
+            # Rejected here so load_hot_config keeps the previous config instead of failing requests
+            raise ValueError(f"Unknown fairness mode: {fairness_mode}")
+        self.discomfort_curve = self._compile_discomfort_curve(self.config["fairness"])
+        self._tables = {}
+    
+    @classmethod
+    def from_file(cls, path):
+        with open(path) as f:
+            return cls(json.load(f))
+    
+    @staticmethod
+    def _compile_rules(rules):
+        table = np.zeros((7, MINUTES_PER_DAY), dtype=np.int32)
+        for rule in rules:
+            days = [DAY_NAMES.index(day) for day in rule.get("days", DAY_NAMES)]
+            start = parse_clock(rule["start"]) if "start" in rule else 0
+            end = parse_clock(rule["end"]) if "end" in rule else MINUTES_PER_DAY
+            table[days, start:end] += rule["score"]
+        return table
+    
+    @staticmethod
+    def _compile_discomfort_curve(fairness):
+        """Hours between each local minute and the comfortable window, going round the clock."""
+        start = parse_clock(fairness["start"])
+        end = parse_clock(fairness["end"])
+        minutes = np.arange(MINUTES_PER_DAY)
+        before = (start - minutes) % MINUTES_PER_DAY
+        after = (minutes - end + 1) % MINUTES_PER_DAY
+        curve = np.minimum(before, after) / 60
+        curve[(minutes >= start) & (minutes < end)] = 0
+        return curve
+    
+    def table_for(self, preferred_times=None, preferred_days=None):
+        """Return the (7, 1440) score table including preferred ranges and days, compiled once per preference set."""
+        if preferred_times is None:
+            preferred_times = self.default_preferred_times
+        if preferred_days is None:
+            preferred_days = self.default_preferred_days
+        
+        key = (tuple(map(tuple, preferred_times)), tuple(preferred_days))
+        table = self._tables.get(key)
+        if table is None:
+            table = self.base_table.copy()
+            # Preferred ranges are inclusive at both ends
+            for start, end in preferred_times:
+                table[:, time_to_minutes(start):time_to_minutes(end) + 1] += self.config["preferred_time_score"]
+            table[sorted(set(preferred_days)), :] += self.config["preferred_day_score"]
+            table.setflags(write=False)
+            self._tables[key] = table
+        return table
+    
+    def score(self, weekdays, start_minutes, preferred_times=None, preferred_days=None):
+        """Score slots given as weekday and start-minute arrays."""
+        table = self.table_for(preferred_times, preferred_days)
+        return table[np.asarray(weekdays), np.asarray(start_minutes)]
+    
+    def score_candidates(self, date_range, day_indices, start_minutes, duration_minutes,
+                         availabilities=(), target_timezone="UTC", preferred_times=None, preferred_days=None,
+                         fairness_mode=None, day_offset=0):
+        """Score slot candidate arrays, including the per-attendee components of the config.
+        
+        fairness_mode ("sum" or "minimax") overrides the configured fairness mode.
+        day_offset is the position of date_range[0] in a longer range, for recency.
+        """
+        weekdays = np.array([date.weekday() for date in date_range], dtype=np.intp)[day_indices]
+        scores = self.score(weekdays, start_minutes, preferred_times, preferred_days)
+        
+        recency = self.config["recency"]["score_per_day"]
+        if recency:
+            scores = scores + recency * (day_indices + day_offset)
+        
+        comfort = self.config["attendee_comfort"]
+        if comfort["score"] and availabilities:
+            scores = scores + comfort["score"] * self._uncomfortable_attendees(
+                date_range, day_indices, start_minutes, duration_minutes, availabilities, target_timezone
+            )
+        
+        fairness_mode = fairness_mode or self.config["fairness"]["mode"]
+        if fairness_mode and availabilities:
+            scores = scores + self.config["fairness"]["score_per_hour"] * self.fairness_penalty(
+                date_range, day_indices, start_minutes, duration_minutes, availabilities, target_timezone,
+                fairness_mode
+            )
+        
+        buffer = self.config["buffer"]
+        if buffer["score"] and buffer["minutes"] and availabilities:
+            scores = scores + buffer["score"] * self._near_meetings(
+                date_range, day_indices, start_minutes, duration_minutes, availabilities, target_timezone
+            )
+        
+        return scores
+    
+    @staticmethod
+    def _local_slot_starts(date_range, day_indices, start_minutes, availabilities, target_timezone):
+        """Return {timezone: (attendee count, local start minute per slot)} for attendees with a timezone.
+        
+        Attendees sharing a timezone share the result, and the target->local offsets
+        are looked up once per date and quarter hour rather than converted per slot.
+        """
+        timezone_counts = defaultdict(int)
+        for availability in availabilities:
+            if availability.timezone and target_timezone:
+                timezone_counts[availability.timezone] += 1
+        
+        start_steps = start_minutes // OFFSET_STEP_MINUTES
+        local_starts = {}
+        for timezone_name, count in timezone_counts.items():
+            offsets = np.stack([
+                date_timezone_offsets(target_timezone, timezone_name, as_date(date))
+                for date in date_range
+            ])
+            local_starts[timezone_name] = (
+                count, (start_minutes + offsets[day_indices, start_steps]) % MINUTES_PER_DAY
+            )
+        return local_starts
+    
+    def _uncomfortable_attendees(self, date_range, day_indices, start_minutes, duration_minutes,
+                                 availabilities, target_timezone):
+        """Count, per slot, the attendees whose local time puts the slot outside their comfort hours."""
+        comfort_start = parse_clock(self.config["attendee_comfort"]["start"])
+        comfort_end = parse_clock(self.config["attendee_comfort"]["end"])
+        counts = np.zeros(len(start_minutes), dtype=np.int32)
+        local_starts = self._local_slot_starts(
+            date_range, day_indices, start_minutes, availabilities, target_timezone
+        )
+        for count, local_start in local_starts.values():
+            local_end = local_start + duration_minutes
+            counts += count * ((local_start < comfort_start) | (local_end > comfort_end))
+        return counts
+    
+    def attendee_discomfort(self, date_range, day_indices, start_minutes, duration_minutes,
+                            availabilities, target_timezone="UTC"):
+        """Return ({timezone: attendee count}, (timezones x slots) discomfort in hours).
+        
+        A slot's discomfort for one attendee is how far, in hours, its local start or
+        end falls outside the comfortable window, whichever is worse.
+        """
+        local_starts = self._local_slot_starts(
+            date_range, day_indices, start_minutes, availabilities, target_timezone
+        )
+        counts = {timezone_name: count for timezone_name, (count, _) in local_starts.items()}
+        if not local_starts:
+            return counts, np.zeros((0, len(start_minutes)))
+        
+        discomfort = np.stack([
+            np.maximum(
+                self.discomfort_curve[local_start],
+                self.discomfort_curve[(local_start + duration_minutes - 1) % MINUTES_PER_DAY]
+            )
+            for _, local_start in local_starts.values()
+        ])
+        return counts, discomfort
+    
+    def fairness_penalty(self, date_range, day_indices, start_minutes, duration_minutes,
+                         availabilities, target_timezone="UTC", mode="sum"):
+        """Combine per-attendee discomfort into one value per slot: total ("sum") or worst ("minimax")."""
+        if mode not in FAIRNESS_MODES:
+            raise ValueError(f"Unknown fairness mode: {mode}")
+        counts, discomfort = self.attendee_discomfort(
+            date_range, day_indices, start_minutes, duration_minutes, availabilities, target_timezone
+        )
+        if not len(discomfort):
+            return np.zeros(len(start_minutes))
+        if mode == "minimax":
+            return discomfort.max(axis=0)
+        return np.asarray(list(counts.values())) @ discomfort
+    
+    def _near_meetings(self, date_range, day_indices, start_minutes, duration_minutes,
+                       availabilities, target_timezone):
+        """Flag slots that start or end within the buffer of any attendee's meeting."""
+        buffer_minutes = self.config["buffer"]["minutes"]
+        # Minutes within the buffer before or after a meeting, per date
+        near = np.zeros((len(date_range), MINUTES_PER_DAY), dtype=bool)
+        for day_index, date in enumerate(date_range):
+            for availability in availabilities:
+                for start, end in availability.busy_on(date, target_timezone):
+                    near[day_index, max(start - buffer_minutes, 0):start] = True
+                    near[day_index, end:end + buffer_minutes] = True
+        
+        prefix = np.zeros((len(date_range), MINUTES_PER_DAY + 1), dtype=np.int32)
+        np.cumsum(near, axis=1, out=prefix[:, 1:])
+        slot_ends = np.minimum(start_minutes + duration_minutes, MINUTES_PER_DAY)
+        return (prefix[day_indices, slot_ends] - prefix[day_indices, start_minutes]) > 0
+
+_scoring_model_lock = threading.Lock()
+_scoring_model_state = {"path": None, "mtime": None, "value": None}
+
+def load_hot_config(state, lock, path, config_class, label):
+    """Return config_class loaded from path (or its defaults), reloading whenever the file changes on disk."""
+    mtime = None
+    if path:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            print(f"{label.capitalize()} {path} not found, using defaults")
+            path = None
+    
+    with lock:
+        if state["value"] is None or state["path"] != path or state["mtime"] != mtime:
+            try:
+                value = config_class.from_file(path) if path else config_class()
+            except (OSError, ValueError, KeyError) as e:
+                # Keep serving the previous config if an edit left the file invalid
+                print(f"Error loading {label} {path}: {e}")
+                if state["value"] is not None:
+                    return state["value"]
+                value = config_class()
+            state.update(path=path, mtime=mtime, value=value)
+        return state["value"]
+
+def get_scoring_model(path=None):
+    """Return the active ScoringModel, reloading the config file whenever it changes on disk."""
+    return load_hot_config(
+        _scoring_model_state, _scoring_model_lock, path or SCORING_CONFIG_PATH, ScoringModel, "scoring config"
+    )
+
+def score_time_slots(weekdays, start_minutes, preferred_times=None, preferred_days=None):
+    """Vectorized score_time_slot over arrays of slot weekdays and start minutes."""
+    return get_scoring_model().score(weekdays, start_minutes, preferred_times, preferred_days)
+
+def top_k_indices(scores, k):
+    """Return indices of the k highest scores, best first, ties broken by position (like a stable sort)."""
+    if k <= 0 or len(scores) == 0:
+        return np.zeros(0, dtype=np.intp)
+    if k < len(scores):
+        # O(n) selection of the k-th best score, then keep everything above it plus the earliest ties
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
 def convert_claude_preferred_times(claude_preferred_times):
     """Convert Claude API time range forme_ranges(clauat to internal format."""
     converted = []
@@ -551,17 +1925,8 @@ def convert_claude_preferred_days(claude_preferred_days):
     }
     return [days_of_week.get(day.lower(), -1) for day in claude_preferred_days if day.lower() in days_of_week]
 
-def find_best_meeting_times(input_data, meeting_duration=60):
-    """Find the best meeting times based on attendee availability."""
-    attendees = input_data['attendees']
-    start_date = datetime.strptime(input_data['date_range']['start'], '%Y-%m-%d')
-    end_date = datetime.strptime(input_data['date_range']['end'], '%Y-%m-%d')
-    target_timezone = input_data.get('target_timezone', "UTC")
-    
-    date_range = get_date_range(start_date, end_date)
-    
-    # Use Claude to analyze preferences (optional)
-    preferences = analyze_meeting_preferences_with_claude(attendees, target_timezone)
+def convert_claude_preferences(preferences):
+    """Convert a Claude preference analysis into (preferred_times, preferred_days), or Nones."""
     preferred_times = None
     preferred_days = None
     
@@ -572,15 +1937,45 @@ def find_best_meeting_times(input_data, meeting_duration=60):
         except Exception as e:
             print(f"Error processing preferences: {e}")
     
-    # Get all available slots
-    available_slots = find_available_slots(attendees, date_range, target_timezone, meeting_duration)
+    return preferred_times, preferred_days
+
+def find_best_meeting_times(input_data, meeting_duration=60, step_minutes=30, top_k=3):
+    """Find the best meeting times based on attendee availability."""
+    attendees = input_data['attendees']
+    start_date = datetime.strptime(input_data['date_range']['start'], '%Y-%m-%d')
+    end_date = datetime.strptime(input_data['date_range']['end'], '%Y-%m-%d')
+    target_timezone = input_data.get('target_timezone', "UTC")
+    
+    date_range = get_date_range(start_date, end_date)
+    
+    # Use Claude to analyze preferences (optional) while the slots are being computed
+    preferences_future = claude_client.submit(analyze_meeting_preferences_with_claude, attendees, target_timezone)
+    
+    # Get all available slots; large panels and quorum requests use the vectorized backend
+    availabilities = resolve_attendees(attendees, date_range)
+    min_attendees = input_data.get('min_attendees')
+    if min_attendees is not None or len(attendees) >= BITMAP_BACKEND_MIN_ATTENDEES:
+        day_indices, start_minutes, attendee_counts = find_slot_candidates_bitmap(
+            attendees, date_range, target_timezone, meeting_duration, step_minutes, min_attendees,
+            availabilities
+        )
+    else:
+        day_indices, start_minutes, attendee_counts = find_slot_candidates(
+            attendees, date_range, target_timezone, meeting_duration, step_minutes, availabilities
+        )
     
-    # Score and sort slots
-    scored_slots = [(slot, score_time_slot(slot, preferred_times, preferred_days)) for slot in available_slots]
-    scored_slots.sort(key=lambda x: x[1], reverse=True)
+    preferences = preferences_future.result()
+    preferred_times, preferred_days = convert_claude_preferences(preferences)
     
-    # Take top 3 slots
-    best_slots = [slot for slot, score in scored_slots[:3]] if scored_slots else []
+    # Score all slots at once and keep the top k; only the winners are rendered
+    scores = get_scoring_model().score_candidates(
+        date_range, day_indices, start_minutes, meeting_duration, availabilities, target_timezone,
+        preferred_times, preferred_days, input_data.get('fairness')
+    )
+    best = top_k_indices(scores, top_k)
+    best_slots = render_slots(
+        date_range, day_indices[best], start_minutes[best], attendee_counts[best], meeting_duration, target_timezone
+    )
     
     result = {
         'best_meeting_times': best_slots,
@@ -594,6 +1989,209 @@ def find_best_meeting_times(input_data, meeting_duration=60):
     
     return result
 
+def iter_scored_slots(availabilities, dates, target_timezone="UTC", duration_minutes=60, step_minutes=30,
+                      preferred_times=None, preferred_days=None, fairness_mode=None):
+    """Lazily yield scored slot dicts in chronological order, scoring one date at a time."""
+    scoring_model = get_scoring_model()
+    for day_index, date, starts in iter_slot_candidates(
+        availabilities, dates, target_timezone, duration_minutes, step_minutes
+    ):
+        scores = scoring_model.score_candidates(
+            [date], np.zeros(len(starts), dtype=np.intp), starts, duration_minutes, availabilities,
+            target_timezone, preferred_times, preferred_days, fairness_mode, day_offset=day_index
+        )
+        for start, score in zip(starts.tolist(), scores.tolist()):
+            slot = format_slot(date, start, duration_minutes, len(availabilities), target_timezone)
+            slot['score'] = score
+            yield slot
+
+def find_next_meeting_times(input_data, meeting_duration=60, step_minutes=30, top_k=3, min_score=0,
+                            horizon_days=183):
+    """Find the earliest top_k slots scoring at least min_score, stopping as soon as they are found.
+    
+    Unlike find_best_meeting_times this walks the dates lazily, so the cost depends on how
+    far away the openings are rather than on the length of the range. date_range.end is
+    optional; without it the search stops after horizon_days.
+    """
+    attendees = input_data['attendees']
+    start_date = datetime.strptime(input_data['date_range']['start'], '%Y-%m-%d')
+    end_date = input_data['date_range'].get('end')
+    if end_date:
+        end_date = datetime.strptime(end_date, '%Y-%m-%d')
+    else:
+        end_date = start_date + timedelta(days=horizon_days - 1)
+    target_timezone = input_data.get('target_timezone', "UTC")
+    
+    preferences_future = claude_client.submit(analyze_meeting_preferences_with_claude, attendees, target_timezone)
+    availabilities = resolve_attendees(attendees, (start_date, end_date))
+    preferences = preferences_future.result()
+    preferred_times, preferred_days = convert_claude_preferences(preferences)
+    
+    slots = iter_scored_slots(
+        availabilities, iter_dates(start_date, end_date), target_timezone, meeting_duration, step_minutes,
+        preferred_times, preferred_days, input_data.get('fairness')
+    )
+    good_slots = (slot for slot in slots if slot['score'] >= min_score)
+    
+    result = {
+        'best_meeting_times': list(itertools.islice(good_slots, top_k)),
+        'meeting_duration_minutes': meeting_duration,
+        'timezone': target_timezone
+    }
+    
+    if preferences and "notes" in preferences:
+        result["analysis_notes"] = preferences["notes"]
+    
+    return result
+
+class SchedulingSession:
+    """Stateful counterpart of find_best_meeting_times for calendars that keep changing.
+    
+    Each attendee's minute grid and the per-day candidates and scores are kept between
+    calls. update_attendee re-parses only that attendee, recomputes only the days whose
+    availability (or meetings) changed, and re-ranks. Preference analysis runs once.
+    Every day is re-scored when the scoring config is hot-reloaded.
+    """
+    
+    def __init__(self, input_data, meeting_duration=60, step_minutes=30, top_k=3):
+        self.attendees = list(input_data['attendees'])
+        start_date = datetime.strptime(input_data['date_range']['start'], '%Y-%m-%d')
+        end_date = datetime.strptime(input_data['date_range']['end'], '%Y-%m-%d')
+        self.date_range = get_date_range(start_date, end_date)
+        self.target_timezone = input_data.get('target_timezone', "UTC")
+        self.min_attendees = input_data.get('min_attendees')
+        self.fairness_mode = input_data.get('fairness')
+        self.meeting_duration = meeting_duration
+        self.step_minutes = step_minutes
+        self.top_k = top_k
+        
+        preferences_future = claude_client.submit(
+            analyze_meeting_preferences_with_claude, self.attendees, self.target_timezone
+        )
+        
+        self.availabilities = resolve_attendees(self.attendees, self.date_range)
+        # Shape: (attendees, days, minutes)
+        self.grids = np.stack([
+            build_availability_grid(availability, self.date_range, self.target_timezone)
+            for availability in self.availabilities
+        ]) if self.availabilities else np.zeros((0, len(self.date_range), MINUTES_PER_DAY), dtype=bool)
+        
+        self.preferences = preferences_future.result()
+        self.preferred_times, self.preferred_days = convert_claude_preferences(self.preferences)
+        
+        # Per-day candidate arrays: start minutes, attendee counts and scores
+        self.day_starts = [None] * len(self.date_range)
+        self.day_counts = [None] * len(self.date_range)
+        self.day_scores = [None] * len(self.date_range)
+        self.scoring_model = get_scoring_model()
+        self._recompute_days(range(len(self.date_range)))
+    
+    def _refresh_scoring_model(self):
+        """Re-score every day if the scoring config was reloaded since the scores were computed."""
+        scoring_model = get_scoring_model()
+        if scoring_model is not self.scoring_model:
+            self.scoring_model = scoring_model
+            for day_index in range(len(self.date_range)):
+                self._score_day(day_index)
+    
+    def _score_day(self, day_index):
+        """Score one day's candidates against that date alone, as iter_scored_slots does."""
+        starts = self.day_starts[day_index]
+        self.day_scores[day_index] = self.scoring_model.score_candidates(
+            [self.date_range[day_index]], np.zeros(len(starts), dtype=np.intp), starts, self.meeting_duration,
+            self.availabilities, self.target_timezone, self.preferred_times, self.preferred_days,
+            self.fairness_mode, day_offset=day_index
+        )
+    
+    def _recompute_days(self, day_indices):
+        """Rebuild the candidates and scores of the given days from the attendee grids."""
+        attendee_total = len(self.availabilities)
+        for day_index in day_indices:
+            grids = self.grids[:, day_index]
+            if not attendee_total:
+                starts = np.zeros(0, dtype=np.int32)
+                counts = starts
+            elif self.min_attendees is None or self.min_attendees >= attendee_total:
+                fits = slot_fits(np.logical_and.reduce(grids, axis=0), self.meeting_duration)
+                starts = np.flatnonzero(aligned_slot_starts(fits, self.step_minutes)).astype(np.int32)
+                counts = np.full(len(starts), attendee_total, dtype=np.int32)
+            else:
+                # An attendee counts towards the quorum only if they are free for the whole slot
+                attendee_counts = slot_fits(grids, self.meeting_duration).sum(axis=0)
+                fits = attendee_counts >= self.min_attendees
+                starts = np.flatnonzero(aligned_slot_starts(fits, self.step_minutes)).astype(np.int32)
+                counts = attendee_counts[starts].astype(np.int32)
+            
+            self.day_starts[day_index] = starts
+            self.day_counts[day_index] = counts
+            self._score_day(day_index)
+    
+    def _changed_days(self, old, new, old_grid, new_grid):
+        """Return the day indices on which one attendee's availability or meetings differ."""
+        if old.timezone != new.timezone:
+            # Comfort and fairness scores depend on the attendee's local time on every day
+            return list(range(len(self.date_range)))
+        changed = (old_grid != new_grid).any(axis=1)
+        if old.weekly_busy != new.weekly_busy or old.busy_events is not None or new.busy_events is not None:
+            for day_index, date in enumerate(self.date_range):
+                if not changed[day_index]:
+                    changed[day_index] = (old.busy_on(date, self.target_timezone)
+                                          != new.busy_on(date, self.target_timezone))
+        return np.flatnonzero(changed).tolist()
+    
+    def update_attendee(self, attendee):
+        """Replace the attendee with the same name (or add a new one) and re-rank.
+        
+        An attendee without a name cannot be matched and is always added.
+        Returns the list of day indices that were recomputed.
+        """
+        self._refresh_scoring_model()
+        new = resolve_attendee_availability(attendee, date_range=self.date_range)
+        new_grid = build_availability_grid(new, self.date_range, self.target_timezone)
+        
+        names = [existing.get('name') for existing in self.attendees]
+        if attendee.get('name') and attendee.get('name') in names:
+            index = names.index(attendee.get('name'))
+            changed_days = self._changed_days(self.availabilities[index], new, self.grids[index], new_grid)
+            self.attendees[index] = attendee
+            self.availabilities[index] = new
+            self.grids[index] = new_grid
+        else:
+            # A new attendee changes the intersection and the per-attendee scores on every day
+            changed_days = list(range(len(self.date_range)))
+            self.attendees.append(attendee)
+            self.availabilities.append(new)
+            self.grids = np.concatenate([self.grids, new_grid[None]])
+        
+        self._recompute_days(changed_days)
+        return changed_days
+    
+    def best_meeting_times(self, top_k=None):
+        """Return the current top slots in the same shape as find_best_meeting_times."""
+        self._refresh_scoring_model()
+        top_k = self.top_k if top_k is None else top_k
+        day_indices = np.concatenate([
+            np.full(len(starts), day_index, dtype=np.intp) for day_index, starts in enumerate(self.day_starts)
+        ]) if self.day_starts else np.zeros(0, dtype=np.intp)
+        start_minutes = np.concatenate(self.day_starts) if self.day_starts else np.zeros(0, dtype=np.int32)
+        attendee_counts = np.concatenate(self.day_counts) if self.day_counts else np.zeros(0, dtype=np.int32)
+        scores = np.concatenate(self.day_scores) if self.day_scores else np.zeros(0, dtype=np.int64)
+        
+        best = top_k_indices(scores, top_k)
+        result = {
+            'best_meeting_times': render_slots(
+                self.date_range, day_indices[best], start_minutes[best], attendee_counts[best],
+                self.meeting_duration, self.target_timezone
+            ),
+            'meeting_duration_minutes': self.meeting_duration,
+            'timezone': self.target_timezone
+        }
+        
+        if self.preferences and "notes" in self.preferences:
+            result["analysis_notes"] = self.preferences["notes"]
+        
+        return result
+
 # Example usage
 if __name__ == "__main__":
     # Sample input with timezone information